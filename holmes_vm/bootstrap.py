@@ -9,11 +9,9 @@ Enhanced with Sherlock Holmes theme.
 
 import os
 import sys
-import subprocess
-import urllib.request
-import tempfile
-import ctypes
-from pathlib import Path
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # ANSI color codes for terminal styling (with ability to disable on unsupported consoles)
@@ -37,8 +35,28 @@ class Colors:
         cls.BOLD = ''
         cls.DIM = ''
         cls.RESET = ''
+        _build_formats()
 
 
+# Message templates, rebuilt whenever the palette changes so the print helpers
+# only do a single %-substitution per call
+STEP_FMT = SUCCESS_FMT = ERROR_FMT = INFO_FMT = WARN_FMT = '%s'
+
+
+def _build_formats():
+    """Pre-render the ANSI-wrapped templates used by the print helpers."""
+    global STEP_FMT, SUCCESS_FMT, ERROR_FMT, INFO_FMT, WARN_FMT
+    STEP_FMT = f"{Colors.GRAY}{Colors.BOLD}[%d/%d]{Colors.RESET} {Colors.BROWN}🔍 %s...{Colors.RESET}"
+    SUCCESS_FMT = f"  {Colors.GREEN}✓ %s{Colors.RESET}"
+    ERROR_FMT = f"  {Colors.RED}✗ %s{Colors.RESET}"
+    INFO_FMT = f"  {Colors.GRAY}→ %s{Colors.RESET}"
+    WARN_FMT = f"  {Colors.GOLD}⚠ %s{Colors.RESET}"
+
+
+_build_formats()
+
+
+@functools.lru_cache(maxsize=16)
 def _hex_to_ansi_fg(hex_code: str) -> str:
     """Convert #RRGGBB to ANSI 24-bit foreground escape sequence."""
     hex_code = hex_code.lstrip('#')
@@ -50,27 +68,43 @@ def _hex_to_ansi_fg(hex_code: str) -> str:
     return f"\033[38;2;{r};{g};{b}m"
 
 
+# UI theme colors as ANSI sequences, computed once at import (None if the
+# palette module is unavailable, e.g. when run outside the package)
+try:
+    from holmes_vm.ui import colors as _ui_colors
+    _PALETTE = {
+        'BROWN': _hex_to_ansi_fg(_ui_colors.COLOR_ACCENT),   # Accent teal
+        'GOLD': _hex_to_ansi_fg(_ui_colors.COLOR_WARN),      # Muted amber
+        'GREEN': _hex_to_ansi_fg(_ui_colors.COLOR_SUCCESS),  # Success teal-green
+        'RED': _hex_to_ansi_fg(_ui_colors.COLOR_ERROR),      # Soft red
+        'GRAY': _hex_to_ansi_fg(_ui_colors.COLOR_MUTED),     # Blue-gray
+        'BOLD': '\033[1m',
+        'DIM': '\033[2m',
+        'RESET': '\033[0m',
+    }
+except Exception:
+    _PALETTE = None
+
+
 def _apply_ui_palette():
     """Map UI hex colors to ANSI sequences for console output."""
-    try:
-        from holmes_vm.ui import colors as ui
-        Colors.BROWN = _hex_to_ansi_fg(ui.COLOR_ACCENT)       # Accent teal
-        Colors.GOLD = _hex_to_ansi_fg(ui.COLOR_WARN)          # Muted amber
-        Colors.GREEN = _hex_to_ansi_fg(ui.COLOR_SUCCESS)      # Success teal-green
-        Colors.RED = _hex_to_ansi_fg(ui.COLOR_ERROR)          # Soft red
-        Colors.GRAY = _hex_to_ansi_fg(ui.COLOR_MUTED)         # Blue-gray
-        Colors.BOLD = '\033[1m'
-        Colors.DIM = '\033[2m'
-        Colors.RESET = '\033[0m'
-    except Exception:
-        # If palette import fails, keep existing defaults (or disabled state)
-        pass
+    # Without the palette keep existing defaults (or disabled state)
+    if _PALETTE:
+        for name, code in _PALETTE.items():
+            setattr(Colors, name, code)
+        _build_formats()
 
 
 def get_banner() -> str:
     """Build the banner string using current Colors (allows disabling later)."""
+    return _render_banner(Colors.BROWN, Colors.BOLD, Colors.RESET)
+
+
+@functools.lru_cache(maxsize=4)
+def _render_banner(color: str, bold: str, reset: str) -> str:
+    """Render the banner once per palette"""
     return (
-        f"{Colors.BROWN}{Colors.BOLD}\n"
+        f"{color}{bold}\n"
         "╔══════════════════════════════════════════════════════════════════════════╗\n"
         "║                                                                          ║\n"
         "║   🔍 SHERLOCK HOLMES • DIGITAL FORENSICS VM BOOTSTRAP                   ║\n"
@@ -79,17 +113,20 @@ def get_banner() -> str:
         "║                                          - A Scandal in Bohemia          ║\n"
         "║                                                                          ║\n"
         "╚══════════════════════════════════════════════════════════════════════════╝\n"
-        f"{Colors.RESET}\n"
+        f"{reset}\n"
     )
 
+@functools.lru_cache(maxsize=1)
 def _try_enable_ansi_on_windows() -> bool:
     """Attempt to enable ANSI escape processing on Windows consoles.
 
-    Returns True if either not on Windows or enabling succeeded.
+    Returns True if either not on Windows or enabling succeeded. Cached: the
+    console mode only needs to be set once per process.
     """
     try:
         if os.name != 'nt':
             return True
+        import ctypes
         # Windows 10+ can support VT with this flag
         kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
         ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
@@ -109,14 +146,18 @@ def _try_enable_ansi_on_windows() -> bool:
     except Exception:
         return False
 
+@functools.lru_cache(maxsize=None)
 def is_admin():
-    """Check if running with administrator privileges"""
+    """Check if running with administrator privileges (cached; cannot change while running)"""
     try:
         # Reuse utility when available, fall back to direct ctypes call
         from holmes_vm.utils.system import is_admin as _is_admin
         return _is_admin()
     except ImportError:
+        if sys.platform != 'win32':
+            return False
         try:
+            import ctypes
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
         except Exception:
             return False
@@ -124,42 +165,47 @@ def is_admin():
 
 def print_header(text):
     """Print a formatted header"""
-    print(f"\n{Colors.BROWN}{Colors.BOLD}{'═' * 76}")
-    print(f"  {text}")
-    print(f"{'═' * 76}{Colors.RESET}\n")
+    sys.stdout.write(f"\n{Colors.BROWN}{Colors.BOLD}{'═' * 76}\n  {text}\n{'═' * 76}{Colors.RESET}\n\n")
 
 
 def print_step(step_num, total, text):
     """Print a step indicator"""
-    print(f"{Colors.GRAY}{Colors.BOLD}[{step_num}/{total}]{Colors.RESET} {Colors.BROWN}🔍 {text}...{Colors.RESET}")
+    print(STEP_FMT % (step_num, total, text))
 
 
 def print_success(text):
     """Print success message"""
-    print(f"  {Colors.GREEN}✓ {text}{Colors.RESET}")
+    print(SUCCESS_FMT % (text,))
 
 
 def print_error(text):
     """Print error message"""
-    print(f"  {Colors.RED}✗ {text}{Colors.RESET}")
+    print(ERROR_FMT % (text,))
 
 
 def print_info(text):
     """Print info message"""
-    print(f"  {Colors.GRAY}→ {text}{Colors.RESET}")
+    print(INFO_FMT % (text,))
 
 
 def print_warning(text):
     """Print warning message"""
-    print(f"  {Colors.GOLD}⚠ {text}{Colors.RESET}")
+    print(WARN_FMT % (text,))
+
+
+def _python_version_ok():
+    """Return True if the running interpreter is Python 3.7 or newer"""
+    return sys.version_info[:2] >= (3, 7)
 
 
-def check_python_version():
-    """Check if Python version is adequate"""
-    print_step(1, 5, "Checking Python version")
+def check_python_version(ok=None):
+    """Check if Python version is adequate (optionally using a precomputed probe result)"""
+    print_step(1, 4, "Checking Python version")
     
     version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 7):
+    if ok is None:
+        ok = _python_version_ok()
+    if not ok:
         print_error(f"Python {version.major}.{version.minor} is too old")
         print_info("Holmes VM requires Python 3.7 or newer")
         print_info("Download from: https://www.python.org/downloads/")
@@ -169,90 +215,229 @@ def check_python_version():
     return True
 
 
-def check_tkinter():
-    """Check if tkinter is available"""
-    print_step(2, 5, "Checking Tkinter (for GUI)")
-    
+def _tkinter_available():
+    """Return True if tkinter is importable (finder lookup only, Tcl/Tk is not started)"""
     try:
-        import tkinter
-        print_success("Tkinter is available")
-        return True
-    except ImportError:
-        print_error("Tkinter not available")
-        print_info("GUI mode will not be available")
-        print_info("You can still use --no-gui flag")
+        return importlib.util.find_spec('tkinter') is not None
+    except (ImportError, ValueError):
         return False
 
 
-def upgrade_pip():
-    """Upgrade pip to latest version"""
-    print_step(3, 5, "Upgrading pip")
+def check_tkinter(available=None):
+    """Check if tkinter is available (optionally using a precomputed probe result)"""
+    print_step(2, 4, "Checking Tkinter (for GUI)")
     
-    try:
-        subprocess.run(
-            [sys.executable, '-m', 'pip', 'install', '--upgrade', 'pip'],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        print_success("pip upgraded to latest version")
+    if available is None:
+        available = _tkinter_available()
+    if available:
+        print_success("Tkinter is available")
         return True
-    except subprocess.CalledProcessError as e:
-        print_error(f"Failed to upgrade pip: {e}")
-        return False
+    print_error("Tkinter not available")
+    print_info("GUI mode will not be available")
+    print_info("You can still use --no-gui flag")
+    return False
+
+
+# pip arguments: skip the self-update check, never prompt, no progress bar rendering
+_PIP_ARGS = [
+    '--disable-pip-version-check', '--no-input',
+    'install', '--upgrade', '--progress-bar', 'off',
+]
+
+
+def _pip_command(upgrading_pip):
+    """Return the argv prefix used to launch pip.
+
+    The standalone pip launcher skips the runpy layer of ``python -m pip``, but is
+    only used when it belongs to this interpreter and pip itself is not being
+    upgraded (Windows locks pip.exe while it runs).
+    """
+    if not upgrading_pip:
+        import shutil
+        exe_dir = os.path.dirname(os.path.realpath(sys.executable))
+        script_dirs = {exe_dir, os.path.join(exe_dir, 'Scripts')}
+        for name in ('pip', 'pip3'):
+            found = shutil.which(name)
+            if found and os.path.dirname(os.path.realpath(found)) in script_dirs:
+                return [found]
+    return [sys.executable, '-m', 'pip']
+
+
+# (package, minimum version); None means any installed version is acceptable
+_DEPENDENCIES = [
+    ('pip', '24.0'),             # Last release that still supports Python 3.7
+    ('setuptools', None),
+    ('wheel', None),
+    ('rich', '13.7.0'),          # Beautiful terminal UI
+    ('customtkinter', '5.2.0'),  # Modern tkinter wrapper with better widgets
+]
+
+# Speedups with a stdlib fallback; installed best effort, never required
+_OPTIONAL_DEPENDENCIES = [
+    ('orjson', '3.9.0'),         # Faster tools.json parsing (stdlib json is the fallback)
+]
+
+
+def _version_tuple(version):
+    """Turn a version string like '13.7.1' into a comparable tuple of ints"""
+    parts = []
+    for piece in version.split('.'):
+        digits = ''
+        for ch in piece:
+            if not ch.isdigit():
+                break
+            digits += ch
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
+
+
+def _missing_dependencies(dependencies=_DEPENDENCIES):
+    """Return pip requirement specs for dependencies that are absent or outdated"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        # Python 3.7 has no importlib.metadata; let pip decide
+        return [pkg if min_ver is None else f"{pkg}>={min_ver}" for pkg, min_ver in dependencies]
+
+    need = []
+    for pkg, min_ver in dependencies:
+        spec = pkg if min_ver is None else f"{pkg}>={min_ver}"
+        try:
+            current = version(pkg)
+        except PackageNotFoundError:
+            need.append(spec)
+            continue
+        if min_ver is not None and _version_tuple(current) < _version_tuple(min_ver):
+            need.append(spec)
+    return need
 
 
 def install_dependencies():
-    """Install required Python packages"""
-    print_step(4, 5, "Installing dependencies")
-    
-    # Core dependencies including Rich for beautiful UI and CustomTkinter for modern GUI
-    dependencies = [
-        'setuptools',
-        'wheel',
-        'rich>=13.7.0',        # Beautiful terminal UI
-        'customtkinter>=5.2.0',  # Modern tkinter wrapper with better widgets
-    ]
+    """Upgrade pip and install required Python packages in a single pip run"""
+    print_step(3, 4, "Installing dependencies")
     
+    # Skip the pip run entirely when everything is already present and recent enough
+    dependencies = _missing_dependencies()
+    if not dependencies:
+        print_info("all dependencies already satisfied")
+        print_success("Dependencies ready (Rich + CustomTkinter for modern UI)")
+        _install_optional_dependencies()
+        return True
+
     print_info(f"Installing: {', '.join(dependencies)}")
     
+    import subprocess
+
+    # Specs stay on argv: pip cannot read a requirements file from stdin ('-r -'),
+    # and the list is a handful of short entries, far below command-line limits
+    upgrading_pip = any(spec.split('>=')[0] == 'pip' for spec in dependencies)
+    cmd = _pip_command(upgrading_pip) + _PIP_ARGS + dependencies
     try:
-        subprocess.run(
-            [sys.executable, '-m', 'pip', 'install', '--upgrade'] + dependencies,
-            check=True,
-            capture_output=True,
-            text=True
+        # Stream pip output as it arrives rather than buffering the whole log
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
         )
-        print_success("Dependencies installed (Rich + CustomTkinter for modern UI)")
-        return True
-    except subprocess.CalledProcessError as e:
+    except OSError as e:
         print_error(f"Failed to install dependencies: {e}")
         return False
 
+    tail = ''
+    for line in proc.stdout:
+        line = line.rstrip()
+        if line:
+            print_info(line)
+            tail = (tail + '\n' + line)[-500:]
+    rc = proc.wait()
+    if rc != 0:
+        print_error(f"pip failed with exit code {rc}: {tail.strip()}")
+        return False
+
+    if upgrading_pip:
+        print_success("pip upgraded and dependencies installed (Rich + CustomTkinter for modern UI)")
+    else:
+        print_success("Dependencies installed (Rich + CustomTkinter for modern UI)")
+    _install_optional_dependencies()
+    return True
+
+
+def _install_optional_dependencies():
+    """Best-effort install of optional speedups; failures only print a warning.
+
+    Kept out of the required pip run so a missing wheel (32-bit/ARM Python,
+    brand new CPython) or an offline index cannot fail the bootstrap.
+    """
+    optional = _missing_dependencies(_OPTIONAL_DEPENDENCIES)
+    if not optional:
+        return
+
+    import subprocess
+
+    print_info(f"Installing optional: {', '.join(optional)}")
+    try:
+        res = subprocess.run(
+            _pip_command(False) + _PIP_ARGS + optional,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+    except OSError as e:
+        print_warning(f"Optional packages not installed ({e}); continuing without them")
+        return
+    if res.returncode != 0:
+        tail = res.stdout.strip()[-300:]
+        print_warning(f"Optional packages not installed (pip exit code {res.returncode}); continuing without them")
+        if tail:
+            print_info(tail)
+
+
+# Package and repository locations, resolved once at import
+_PKG_DIR = os.path.dirname(os.path.realpath(__file__))
+_REPO_ROOT = os.path.dirname(_PKG_DIR)
 
-def verify_installation():
-    """Verify the installation is ready"""
-    print_step(5, 5, "Verifying installation")
 
-    pkg_dir = Path(__file__).resolve().parent
-    repo_root = pkg_dir.parent
+def _dir_entries(path):
+    """Return the set of entry names in a directory (empty if it does not exist)"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _required_files_present():
+    """Return (setup_ok, config_ok, module_ok) for the files setup needs"""
+    # One directory listing per parent instead of a stat per required file:
+    # setup.py inside the package, config at repo root and the PowerShell
+    # module under scripts/windows
+    return (
+        'setup.py' in _dir_entries(_PKG_DIR),
+        'tools.json' in _dir_entries(os.path.join(_REPO_ROOT, 'config')),
+        'Holmes.Common.psm1' in _dir_entries(os.path.join(_REPO_ROOT, 'scripts', 'windows')),
+    )
 
-    # Check if setup.py exists (module file inside package)
-    setup_path = pkg_dir / 'setup.py'
-    if not setup_path.exists():
+
+def verify_installation(present=None):
+    """Verify the installation is ready (optionally using a precomputed probe result)"""
+    print_step(4, 4, "Verifying installation")
+
+    if present is None:
+        present = _required_files_present()
+    setup_ok, config_ok, module_ok = present
+
+    if not setup_ok:
         print_error("holmes_vm/setup.py not found")
         print_info("Ensure you cloned the repository correctly")
         return False
 
-    # Check if config exists at repo root
-    config_path = repo_root / 'config' / 'tools.json'
-    if not config_path.exists():
+    if not config_ok:
         print_error("config/tools.json not found at repository root")
         return False
 
-    # Check if PowerShell module exists under scripts/windows at repo root
-    module_path = repo_root / 'scripts' / 'windows' / 'Holmes.Common.psm1'
-    if not module_path.exists():
+    if not module_ok:
         print_error("scripts/windows/Holmes.Common.psm1 not found at repository root")
         return False
 
@@ -261,14 +446,19 @@ def verify_installation():
     return True
 
 
-def check_admin_rights():
-    """Check and warn about admin rights"""
-    if not is_admin():
-        print(f"\n{Colors.GOLD}{Colors.BOLD}{'!' * 76}")
-        print("  ⚠  WARNING: Not running as Administrator")
-        print("  Holmes VM requires Administrator privileges to install tools")
-        print("  Please run this script (and setup.py) as Administrator")
-        print(f"{'!' * 76}{Colors.RESET}\n")
+def check_admin_rights(admin=None):
+    """Check and warn about admin rights (optionally using a precomputed probe result)"""
+    if admin is None:
+        admin = is_admin()
+    if not admin:
+        sys.stdout.write(
+            f"\n{Colors.GOLD}{Colors.BOLD}{'!' * 76}\n"
+            "  ⚠  WARNING: Not running as Administrator\n"
+            "  Holmes VM requires Administrator privileges to install tools\n"
+            "  Please run this script (and setup.py) as Administrator\n"
+            f"{'!' * 76}{Colors.RESET}\n\n"
+        )
+        sys.stdout.flush()
         return False
     else:
         print_success("Running with Administrator privileges")
@@ -285,70 +475,86 @@ def main():
         Colors.disable()
 
     # Print banner
-    print(get_banner())
+    sys.stdout.write(get_banner() + "\n")
     
     print_header("Holmes VM Bootstrap Script")
-    print(f"{Colors.DIM}This script prepares your system to run Holmes VM setup.")
-    print(f"Make sure you're running this as Administrator!{Colors.RESET}\n")
+    sys.stdout.write(
+        f"{Colors.DIM}This script prepares your system to run Holmes VM setup.\n"
+        f"Make sure you're running this as Administrator!{Colors.RESET}\n\n"
+    )
+    sys.stdout.flush()
     
+    # Independent probes run concurrently; results are reported below in a fixed order
+    probes = {
+        'admin': is_admin,
+        'python': _python_version_ok,
+        'tkinter': _tkinter_available,
+        'files': _required_files_present,
+    }
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(probes)) as ex:
+        futures = {ex.submit(fn): name for name, fn in probes.items()}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
     # Check admin rights
-    is_admin_user = check_admin_rights()
+    is_admin_user = check_admin_rights(results['admin'])
     
     # Run all checks and setup steps
     steps_passed = 0
-    total_steps = 5
+    total_steps = 4
     
-    if check_python_version():
+    if check_python_version(results['python']):
         steps_passed += 1
     else:
         print(f"\n{Colors.RED}{Colors.BOLD}❌ Python version check failed. Please upgrade Python.{Colors.RESET}")
         sys.exit(1)
     
-    if check_tkinter():
+    if check_tkinter(results['tkinter']):
         steps_passed += 1
     else:
         print_info("Continuing without GUI support...")
         steps_passed += 1  # Not critical
     
-    if upgrade_pip():
-        steps_passed += 1
-    else:
-        print_warning("pip upgrade failed, but continuing...")
-        steps_passed += 1  # Not critical
-    
     if install_dependencies():
         steps_passed += 1
     else:
         print(f"\n{Colors.RED}{Colors.BOLD}❌ Dependency installation failed.{Colors.RESET}")
         sys.exit(1)
     
-    if verify_installation():
+    if verify_installation(results['files']):
         steps_passed += 1
     else:
         print(f"\n{Colors.RED}{Colors.BOLD}❌ Installation verification failed.{Colors.RESET}")
         sys.exit(1)
     
-    # Final summary
+    # Final summary, assembled and written in one go
     print_header("Bootstrap Complete!")
-    print(f"{Colors.GREEN}{Colors.BOLD}✓ All {steps_passed}/{total_steps} steps completed successfully!{Colors.RESET}\n")
+    lines = [f"{Colors.GREEN}{Colors.BOLD}✓ All {steps_passed}/{total_steps} steps completed successfully!{Colors.RESET}\n"]
     
     if is_admin_user:
-        print(f"{Colors.BROWN}You can now run Holmes VM setup:{Colors.RESET}")
-        print(f"  {Colors.BOLD}python holmes_vm/setup.py{Colors.RESET}")
+        lines += [
+            f"{Colors.BROWN}You can now run Holmes VM setup:{Colors.RESET}",
+            f"  {Colors.BOLD}python holmes_vm/setup.py{Colors.RESET}",
+        ]
     else:
-        print(f"{Colors.GOLD}⚠  IMPORTANT: Run setup as Administrator:{Colors.RESET}")
-        print("  1. Open Command Prompt or PowerShell as Administrator")
-        print("  2. Navigate to this directory")
-        print(f"  3. Run: {Colors.BOLD}python holmes_vm/setup.py{Colors.RESET}")
-    
-    print(f"\n{Colors.DIM}Other options:{Colors.RESET}")
-    print(f"  {Colors.BROWN}python holmes_vm/setup.py --no-gui{Colors.RESET}       # Console mode with Rich UI")
-    print(f"  {Colors.BROWN}python holmes_vm/setup.py --what-if{Colors.RESET}      # Test mode")
-    print(f"  {Colors.BROWN}python holmes_vm/setup.py --help{Colors.RESET}         # Show all options")
+        lines += [
+            f"{Colors.GOLD}⚠  IMPORTANT: Run setup as Administrator:{Colors.RESET}",
+            "  1. Open Command Prompt or PowerShell as Administrator",
+            "  2. Navigate to this directory",
+            f"  3. Run: {Colors.BOLD}python holmes_vm/setup.py{Colors.RESET}",
+        ]
     
-    print(f"\n{Colors.DIM}For more information, see README.md{Colors.RESET}")
-    print(f"{Colors.BROWN}{'═' * 76}{Colors.RESET}\n")
-
+    lines += [
+        f"\n{Colors.DIM}Other options:{Colors.RESET}",
+        f"  {Colors.BROWN}python holmes_vm/setup.py --no-gui{Colors.RESET}       # Console mode with Rich UI",
+        f"  {Colors.BROWN}python holmes_vm/setup.py --what-if{Colors.RESET}      # Test mode",
+        f"  {Colors.BROWN}python holmes_vm/setup.py --help{Colors.RESET}         # Show all options",
+        f"\n{Colors.DIM}For more information, see README.md{Colors.RESET}",
+        f"{Colors.BROWN}{'═' * 76}{Colors.RESET}\n",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 if __name__ == '__main__':
     try:
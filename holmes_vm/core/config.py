@@ -6,33 +6,43 @@ Configuration management for Holmes VM
 
 import os
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    # Parses bytes directly in C; optional, the stdlib parser is the fallback
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Repository layout, resolved once at import
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_DEFAULT_CONFIG_DIR = os.path.join(_REPO_ROOT, 'config')
+_UTIL_DIR = os.path.join(_REPO_ROOT, 'scripts', 'windows')
+_MODULE_PATH = os.path.join(_UTIL_DIR, 'Holmes.Common.psm1')
+_ASSETS_DIR = os.path.join(_REPO_ROOT, 'holmes_vm', 'assets')
 
 
 class Config:
     """Configuration manager for Holmes VM setup"""
     
     def __init__(self, config_dir: Optional[str] = None):
-        if config_dir is None:
-            # Default to config directory in project root
-            self.config_dir = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                'config'
-            )
-        else:
-            self.config_dir = config_dir
+        # Default to config directory in project root
+        self.config_dir = _DEFAULT_CONFIG_DIR if config_dir is None else config_dir
             
-        self.repo_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        # Update to scripts/windows for PowerShell module
-        self.module_path = os.path.join(self.repo_dir, 'scripts', 'windows', 'Holmes.Common.psm1')
-        self.util_dir = os.path.join(self.repo_dir, 'scripts', 'windows')
+        self.repo_dir = _REPO_ROOT
+        # PowerShell module and helper scripts live in scripts/windows
+        self.module_path = _MODULE_PATH
+        self.util_dir = _UTIL_DIR
         # Assets moved inside package
-        self.assets_dir = os.path.join(self.repo_dir, 'holmes_vm', 'assets')
+        self.assets_dir = _ASSETS_DIR
         
         # Load tools configuration
         self.tools_config = self._load_tools_config()
         # Optional versions map at top-level: { "versions": { "wireshark": "x.y.z" } }
         self.versions = self.tools_config.get('versions', {})
+        self._build_index()
         
     def _load_tools_config(self) -> Dict[str, Any]:
         """Load tools configuration from JSON"""
@@ -46,44 +56,73 @@ class Config:
             )
             return {"categories": []}
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(config_file, 'rb') as f:
+                data = _json_loads(f.read())
             if not isinstance(data, dict):
                 raise ValueError("tools.json root must be a JSON object")
             return data
-        except (json.JSONDecodeError, ValueError) as e:
+        except ValueError as e:  # includes json/orjson JSONDecodeError
             import warnings
             warnings.warn(f"Failed to parse {config_file}: {e}", stacklevel=2)
             return {"categories": []}
     
+    def _build_index(self):
+        """Index tools by ID and check the config structure in one pass.
+
+        Problems are collected as (level, message) pairs and reported by validate().
+        """
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._validation_errors: List[Tuple[str, str]] = []
+        all_ids: List[str] = []
+        default_ids: List[str] = []
+        errors = self._validation_errors
+        cats = self.get_categories()
+        if not isinstance(cats, list):
+            errors.append(('error', 'Invalid config: categories must be a list'))
+            cats = []
+        for cidx, cat in enumerate(cats):
+            if 'id' not in cat or 'name' not in cat:
+                errors.append(('warn', f"Category at index {cidx} is missing 'id' or 'name'"))
+            items = cat.get('items', [])
+            if not isinstance(items, list):
+                errors.append(('error', f"Category '{cat.get('id', '?')}' has invalid 'items' (must be list)"))
+                continue
+            for item in items:
+                iid = item.get('id')
+                self._by_id.setdefault(iid, item)  # first match wins, as with a scan
+                all_ids.append(iid)
+                if item.get('default', False):
+                    default_ids.append(iid)
+                itype = item.get('installer_type')
+                if not iid or not item.get('name') or not itype:
+                    errors.append(('error', f"Item missing required fields (id/name/installer_type): {item}"))
+                elif itype == 'chocolatey':
+                    if not item.get('package_name'):
+                        errors.append(('error', f"[{iid}] chocolatey item missing 'package_name'"))
+                elif itype == 'powershell':
+                    if not item.get('script_path') or not item.get('function_name'):
+                        errors.append(('error', f"[{iid}] powershell item missing 'script_path' or 'function_name'"))
+                elif itype == 'function':
+                    if not item.get('installer'):
+                        errors.append(('error', f"[{iid}] function item missing 'installer'"))
+        self._all_ids = tuple(all_ids)
+        self._default_ids = tuple(default_ids)
+
     def get_categories(self) -> List[Dict[str, Any]]:
         """Get all tool categories"""
         return self.tools_config.get('categories', [])
     
     def get_tool_by_id(self, tool_id: str) -> Optional[Dict[str, Any]]:
         """Find a tool by its ID"""
-        for category in self.get_categories():
-            for item in category.get('items', []):
-                if item.get('id') == tool_id:
-                    return item
-        return None
+        return self._by_id.get(tool_id)
     
     def get_all_tool_ids(self) -> List[str]:
         """Get list of all tool IDs"""
-        tool_ids: List[str] = []
-        for category in self.get_categories():
-            for item in category.get('items', []):
-                tool_ids.append(item.get('id'))
-        return tool_ids
+        return list(self._all_ids)
     
     def get_default_tool_ids(self) -> List[str]:
         """Get list of tools that are selected by default"""
-        tool_ids: List[str] = []
-        for category in self.get_categories():
-            for item in category.get('items', []):
-                if item.get('default', False):
-                    tool_ids.append(item.get('id'))
-        return tool_ids
+        return list(self._default_ids)
 
     # New helpers for versioning and normalized lookups
     def get_version_for(self, tool_id: str) -> Optional[str]:
@@ -131,45 +170,10 @@ class Config:
 
     def validate(self, logger: Optional[Any] = None) -> bool:
         """Validate tools.json structure and report issues. Returns True if valid enough to proceed."""
-        ok = True
-        cats = self.get_categories()
-        if not isinstance(cats, list):
-            if logger:
-                logger.error('Invalid config: categories must be a list')
-            return False
-        for cidx, cat in enumerate(cats):
-            if 'id' not in cat or 'name' not in cat:
-                ok = False
-                if logger:
-                    logger.warn(f"Category at index {cidx} is missing 'id' or 'name'")
-            items = cat.get('items', [])
-            if not isinstance(items, list):
-                ok = False
-                if logger:
-                    logger.error(f"Category '{cat.get('id', '?')}' has invalid 'items' (must be list)")
-                continue
-            for item in items:
-                iid = item.get('id')
-                iname = item.get('name')
-                itype = item.get('installer_type')
-                if not iid or not iname or not itype:
-                    ok = False
-                    if logger:
-                        logger.error(f"Item missing required fields (id/name/installer_type): {item}")
-                    continue
-                if itype == 'chocolatey' and not item.get('package_name'):
-                    ok = False
-                    if logger:
-                        logger.error(f"[{iid}] chocolatey item missing 'package_name'")
-                if itype == 'powershell' and (not item.get('script_path') or not item.get('function_name')):
-                    ok = False
-                    if logger:
-                        logger.error(f"[{iid}] powershell item missing 'script_path' or 'function_name'")
-                if itype == 'function' and not item.get('installer'):
-                    ok = False
-                    if logger:
-                        logger.error(f"[{iid}] function item missing 'installer'")
-        return ok
+        if logger:
+            for level, message in self._validation_errors:
+                logger.log(level, message)
+        return not self._validation_errors
 
 
 # Global config instance
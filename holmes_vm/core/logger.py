@@ -8,168 +8,416 @@ to match the UI palette.
 
 import os
 import sys
-import ctypes
+import atexit
+import functools
+import queue
 import threading
+import time
 from datetime import datetime
 from typing import Optional, Any
 
+# Canonical upper-case level names, avoids str.upper() per record
+_LEVELS = {
+    'INFO': 'INFO', 'info': 'INFO',
+    'WARN': 'WARN', 'warn': 'WARN',
+    'ERROR': 'ERROR', 'error': 'ERROR',
+    'SUCCESS': 'SUCCESS', 'success': 'SUCCESS',
+    'VERBOSE': 'VERBOSE', 'verbose': 'VERBOSE',
+}
+
+# Severity per level for the HOLMES_LOG_LEVEL threshold; lines logged with
+# verbose=True rank as VERBOSE whatever their level
+LEVEL_NUMBERS = {'VERBOSE': 5, 'INFO': 10, 'SUCCESS': 15, 'WARN': 20, 'ERROR': 30}
+
+
+def _min_level_from_env() -> int:
+    """Read HOLMES_LOG_LEVEL (a level name or number); default keeps everything"""
+    raw = os.environ.get('HOLMES_LOG_LEVEL', '').strip()
+    if not raw:
+        return 0
+    if raw.upper() in LEVEL_NUMBERS:
+        return LEVEL_NUMBERS[raw.upper()]
+    try:
+        return int(raw)
+    except ValueError:
+        return 0
+
+
+# Bit per UI log tag; UIs expose `level_mask` so filtered lines are never queued
+LEVEL_BITS = {'info': 1, 'warn': 2, 'error': 4, 'success': 8, 'verbose': 16}
+LEVEL_MASK_ALL = 0x1F
+
+# Log line template: [HH:MM:SS.mmm][LEVEL][step] message
+_LINE_FMT = '[%s.%03d][%s]%s %s\n'
+
+# (epoch second, 'HH:MM:SS') of the last record; most records share the second
+_ts_cache = (-1, '')
+
+# Log file open flags (O_BINARY only exists, and matters, on Windows)
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+
+# Tells the writer thread to flush, close the file and exit
+_CLOSE = object()
+
+
+# VT mode and the theme palette are process-wide: resolved once, shared by all loggers
+
+
+def _hex_to_ansi_fg(hex_code: str) -> str:
+    """Convert #RRGGBB to ANSI 24-bit foreground sequence."""
+    try:
+        hex_code = hex_code.lstrip('#')
+        if len(hex_code) != 6:
+            return ''
+        r = int(hex_code[0:2], 16)
+        g = int(hex_code[2:4], 16)
+        b = int(hex_code[4:6], 16)
+        return f"\033[38;2;{r};{g};{b}m"
+    except Exception:
+        return ''
+
+
+@functools.lru_cache(maxsize=1)
+def _build_palette() -> dict:
+    """Build ANSI palette based on UI theme colors (once per process; treat as read-only)."""
+    try:
+        from holmes_vm.ui import colors as ui
+        return {
+            'INFO': _hex_to_ansi_fg(ui.COLOR_INFO),
+            'WARN': _hex_to_ansi_fg(ui.COLOR_WARN),
+            'ERROR': _hex_to_ansi_fg(ui.COLOR_ERROR),
+            'SUCCESS': _hex_to_ansi_fg(ui.COLOR_SUCCESS),
+            'VERBOSE': _hex_to_ansi_fg(ui.COLOR_MUTED_DARK),
+            'MUTED': _hex_to_ansi_fg(ui.COLOR_MUTED),
+            'DIM': '\033[2m',
+            'BOLD': '\033[1m',
+            'RESET': '\033[0m',
+        }
+    except Exception:
+        # Fallback to simple green/yellow/red/blue if UI colors unavailable
+        return {
+            'INFO': '\033[36m',  # cyan
+            'WARN': '\033[33m',  # yellow
+            'ERROR': '\033[31m', # red
+            'SUCCESS': '\033[32m',
+            'VERBOSE': '\033[90m',
+            'MUTED': '\033[90m',
+            'DIM': '\033[2m',
+            'BOLD': '\033[1m',
+            'RESET': '\033[0m',
+        }
+
+
+@functools.lru_cache(maxsize=1)
+def _enable_vt_on_windows() -> bool:
+    """Try enabling VT processing on Windows consoles."""
+    try:
+        if os.name != 'nt':
+            return True
+        import ctypes
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        for handle in (-11, -12):  # STD_OUTPUT_HANDLE, STD_ERROR_HANDLE
+            h = kernel32.GetStdHandle(handle)
+            if h in (0, -1):
+                continue
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(h, ctypes.byref(mode)):
+                continue
+            new_mode = mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            kernel32.SetConsoleMode(h, new_mode)
+        return True
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_ansi_support() -> bool:
+    """Detect if ANSI colors should be used in plain console fallback (once per process)."""
+    if not sys.stdout.isatty():
+        return False
+    if os.name != 'nt':
+        return True
+    # Windows: try to enable VT
+    return _enable_vt_on_windows()
+
+
+# Palette used when colors are off
+_PLAIN_PALETTE = {
+    'INFO': '', 'WARN': '', 'ERROR': '', 'SUCCESS': '', 'VERBOSE': '',
+    'DIM': '', 'BOLD': '', 'RESET': '', 'MUTED': ''
+}
+
 
 class Logger:
     """Thread-safe logger with UI integration support (GUI and Rich console)"""
+
+    # Seconds between writer-thread flushes of the log file
+    _FLUSH_INTERVAL = 0.2
     
     def __init__(self, log_file: str, ui: Optional[Any] = None, rich_console: Optional[Any] = None):
         self.log_file = log_file
         self.ui = ui  # GUI UI object
         self.rich_console = rich_console  # Rich console UI object
         os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
-        self._lock = threading.Lock()
-        self.current_step = None  # Optional context injected by runner
+        # Keep the log file open for the process lifetime. Callers only enqueue
+        # encoded lines; a writer thread collects them in its own byte buffer and
+        # writes it out when it reaches HOLMES_LOG_BUF bytes, every
+        # _FLUSH_INTERVAL seconds, and at once for warnings/errors
+        try:
+            # Raw append-only descriptor: the writer's buffer is the only one, and
+            # O_APPEND lets the OS place each write at the end of the file
+            self._fd = os.open(self.log_file, _OPEN_FLAGS, 0o644)
+        except OSError:
+            self._fd = None
+        try:
+            self._buf_limit = max(1, int(os.environ.get('HOLMES_LOG_BUF', 1 << 16)))
+        except ValueError:
+            self._buf_limit = 1 << 16
+        # Plain console mode: let stdout coalesce bursts; it is flushed with the
+        # file by the writer thread and immediately for warnings/errors
+        self._console = ui is None and rich_console is None
+        # Rich sink per level, bound once instead of an if/elif ladder per record
+        self._rich_dispatch = {}
+        if rich_console is not None:
+            self._rich_dispatch = {
+                'INFO': rich_console.log_info,
+                'SUCCESS': rich_console.log_success,
+                'WARN': rich_console.log_warning,
+                'ERROR': rich_console.log_error,
+                'VERBOSE': getattr(rich_console, 'log_verbose', rich_console.log_info),
+            }
+        # Byte stream for console lines: when stdout is UTF-8 the encoded line is
+        # written straight to its buffer, skipping the text codec
+        self._out = None
+        if self._console:
+            try:
+                sys.stdout.reconfigure(line_buffering=False)
+            except Exception:
+                pass
+            if (getattr(sys.stdout, 'encoding', '') or '').lower().replace('-', '') == 'utf8' \
+                    and hasattr(sys.stdout, 'buffer'):
+                self._flush_stdout()  # keep earlier text-layer output ahead of ours
+                self._out = sys.stdout.buffer
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        if self._fd is not None:
+            self._writer = threading.Thread(
+                target=self._drain, args=(self._fd,), name='holmes-log-writer', daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
+        # Optional context injected by runner; per thread so parallel steps keep their own
+        self._ctx = threading.local()
         # Use a clearly named flag for verbosity to avoid name clashes with methods
         self._verbose_enabled = True
+        # Records below this severity are dropped before any formatting
+        self.min_level = _min_level_from_env()
         # Prepare ANSI color palette for plain console fallback
-        self._ansi_enabled = self._detect_ansi_support()
-        self._palette = self._build_palette() if self._ansi_enabled else {
-            'INFO': '', 'WARN': '', 'ERROR': '', 'SUCCESS': '', 'VERBOSE': '',
-            'DIM': '', 'BOLD': '', 'RESET': '', 'MUTED': ''
-        }
+        self._ansi_enabled = _detect_ansi_support()
+        self._palette = _build_palette() if self._ansi_enabled else _PLAIN_PALETTE
+        # Colored console line per level: [ts] dim, level token colored, rest
+        # tinted by level. Each entry holds a str template filled with
+        # (hh:mm:ss, ms, ctx, msg) and, for the bytes path, encoded
+        # (head, mid, tail) pieces spliced around the already-encoded line
+        self._ansi_tmpl = {lvl: self._ansi_entry(lvl) for lvl in LEVEL_NUMBERS}
 
-    @staticmethod
-    def _hex_to_ansi_fg(hex_code: str) -> str:
-        """Convert #RRGGBB to ANSI 24-bit foreground sequence."""
-        try:
-            hex_code = hex_code.lstrip('#')
-            if len(hex_code) != 6:
-                return ''
-            r = int(hex_code[0:2], 16)
-            g = int(hex_code[2:4], 16)
-            b = int(hex_code[4:6], 16)
-            return f"\033[38;2;{r};{g};{b}m"
-        except Exception:
-            return ''
+    def _ansi_entry(self, lvl: str) -> tuple:
+        """Build the colored console template and byte pieces for one level"""
+        pal = self._palette
+        reset = pal['RESET']
+        lvl_color = pal.get(lvl, pal['INFO'])
+        tint = pal['VERBOSE'] if lvl == 'VERBOSE' else (
+            lvl_color if lvl in ('WARN', 'ERROR', 'SUCCESS', 'INFO') else '')
+        head = pal['DIM']
+        mid = f"{reset}{tint}[{lvl_color}{lvl}{reset}{tint}]"
+        tail = f"{reset if tint else ''}\n"
+        # The encoded line starts with '[HH:MM:SS.mmm]' (14 bytes) then '[LEVEL]'
+        rest_at = 16 + len(lvl.encode('utf-8', 'ignore'))
+        return (
+            f"{head}[%s.%03d]{mid}%s %s{tail}",
+            (head.encode(), mid.encode('utf-8', 'ignore'), tail.encode(), rest_at),
+        )
 
-    def _build_palette(self) -> dict:
-        """Build ANSI palette based on UI theme colors."""
-        try:
-            from holmes_vm.ui import colors as ui
-            return {
-                'INFO': self._hex_to_ansi_fg(ui.COLOR_INFO),
-                'WARN': self._hex_to_ansi_fg(ui.COLOR_WARN),
-                'ERROR': self._hex_to_ansi_fg(ui.COLOR_ERROR),
-                'SUCCESS': self._hex_to_ansi_fg(ui.COLOR_SUCCESS),
-                'VERBOSE': self._hex_to_ansi_fg(ui.COLOR_MUTED_DARK),
-                'MUTED': self._hex_to_ansi_fg(ui.COLOR_MUTED),
-                'DIM': '\033[2m',
-                'BOLD': '\033[1m',
-                'RESET': '\033[0m',
-            }
-        except Exception:
-            # Fallback to simple green/yellow/red/blue if UI colors unavailable
-            return {
-                'INFO': '\033[36m',  # cyan
-                'WARN': '\033[33m',  # yellow
-                'ERROR': '\033[31m', # red
-                'SUCCESS': '\033[32m',
-                'VERBOSE': '\033[90m',
-                'MUTED': '\033[90m',
-                'DIM': '\033[2m',
-                'BOLD': '\033[1m',
-                'RESET': '\033[0m',
-            }
+    @property
+    def current_step(self) -> Optional[str]:
+        """Name of the step running on the calling thread (used as log context)"""
+        return getattr(self._ctx, 'step', None)
 
-    @staticmethod
-    def _enable_vt_on_windows() -> bool:
-        """Try enabling VT processing on Windows consoles."""
+    @current_step.setter
+    def current_step(self, name: Optional[str]):
+        self._ctx.step = name
+
+    def _write_file(self, data: bytes, flush: bool = False, console=None):
+        """Queue an encoded log line (and its plain-console form, if any) for the writer thread.
+
+        Without a writer (log file unavailable or logger closed) the console
+        output is written inline.
+        """
+        if self._fd is not None:
+            self._q.put((data, flush, console))
+        elif console is not None:
+            self._write_console(console)
+            if flush:
+                self._flush_stdout()
+
+    def _write_console(self, chunk):
+        """Write bytes (stdout buffer) or text (stdout) for plain console mode"""
         try:
-            if os.name != 'nt':
-                return True
-            kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
-            ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
-            for handle in (-11, -12):  # STD_OUTPUT_HANDLE, STD_ERROR_HANDLE
-                h = kernel32.GetStdHandle(handle)
-                if h in (0, -1):
-                    continue
-                mode = ctypes.c_uint32()
-                if not kernel32.GetConsoleMode(h, ctypes.byref(mode)):
-                    continue
-                new_mode = mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING
-                kernel32.SetConsoleMode(h, new_mode)
-            return True
+            if self._out is not None:
+                self._out.write(chunk)
+            else:
+                sys.stdout.write(chunk)
         except Exception:
-            return False
+            pass
 
-    def _detect_ansi_support(self) -> bool:
-        """Detect if ANSI colors should be used in plain console fallback."""
-        if not sys.stdout.isatty():
-            return False
-        if os.name != 'nt':
-            return True
-        # Windows: try to enable VT
-        return self._enable_vt_on_windows()
+    def flush(self):
+        """Ask the writer thread to flush buffered lines to disk"""
+        if self._fd is not None:
+            self._q.put((b'', True, None))
+
+    @staticmethod
+    def _write_all(fd: int, data):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
 
-    def _write_file(self, line: str):
-        """Write log line to file"""
-        with self._lock:
+    def _drain(self, fd: int):
+        """Writer loop: gather everything outstanding into one buffer, write it in one call"""
+        # Staging buffer allocated once and refilled in place, so steady-state
+        # logging does not grow and free a new buffer every flush
+        size = self._buf_limit
+        buf = bytearray(size)
+        view = memoryview(buf)
+        n = 0
+        joiner = b'' if self._out is not None else ''
+        last_flush = time.monotonic()
+        while True:
             try:
-                with open(self.log_file, 'a', encoding='utf-8', errors='ignore') as f:
-                    f.write(line)
+                item = self._q.get(timeout=self._FLUSH_INTERVAL)
+            except queue.Empty:
+                item = None
+            urgent = closing = False
+            console = []
+            try:
+                while item is not None:
+                    if item is _CLOSE:
+                        closing = True
+                    else:
+                        data = item[0]
+                        end = n + len(data)
+                        if end > size:
+                            # Full: write out what is staged, then stage this line
+                            # (or write it directly if it alone exceeds the buffer)
+                            self._write_all(fd, view[:n])
+                            n = 0
+                            end = len(data)
+                        if end > size:
+                            self._write_all(fd, data)
+                        else:
+                            view[n:end] = data
+                            n = end
+                        urgent = urgent or item[1]
+                        if item[2] is not None:
+                            console.append(item[2])
+                    try:
+                        item = self._q.get_nowait()
+                    except queue.Empty:
+                        item = None
+                if console:
+                    self._write_console(joiner.join(console))
+                now = time.monotonic()
+                if n and (urgent or closing or n >= size
+                          or now - last_flush >= self._FLUSH_INTERVAL):
+                    self._write_all(fd, view[:n])
+                    n = 0
+                    if self._console:
+                        self._flush_stdout()
+                    last_flush = now
+                if closing:
+                    view.release()
+                    os.close(fd)
+                    return
             except Exception:
-                pass
+                n = 0
+                if closing:
+                    return
+
+    @staticmethod
+    def _flush_stdout():
+        try:
+            sys.stdout.flush()
+        except Exception:
+            pass
+
+    def close(self):
+        """Write out pending lines, stop the writer thread and close the log file"""
+        writer, self._writer = self._writer, None
+        self._fd = None
+        if writer is not None:
+            self._q.put(_CLOSE)
+            writer.join(timeout=5)
+        if self._console:
+            self._flush_stdout()
 
     def log(self, level: str, msg: str, verbose: bool = False):
         """Log a message with specified level"""
-        ts = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        ctx = f"[{self.current_step}]" if self.current_step else ""
-        line = f"[{ts}][{level.upper()}]{ctx} {msg}\n"
-        
-        # Always write to file
-        self._write_file(line)
+        if verbose and not self._verbose_enabled:
+            return  # Verbosity off: drop before any formatting or I/O
+        lvl = _LEVELS.get(level) or level.upper()
+        if self.min_level and (5 if verbose else LEVEL_NUMBERS.get(lvl, 10)) < self.min_level:
+            return
+        global _ts_cache
+        t = time.time()
+        sec = int(t)
+        ms = int((t - sec) * 1000)
+        cached_sec, hms = _ts_cache
+        if sec != cached_sec:
+            hms = time.strftime('%H:%M:%S', time.localtime(sec))
+            _ts_cache = (sec, hms)  # swapped as one tuple, safe across threads
+        step = getattr(self._ctx, 'step', None)
+        ctx = f"[{step}]" if step else ""
+        line = _LINE_FMT % (hms, ms, lvl, ctx, msg)
+        data = line.encode('utf-8', 'ignore')  # shared by the file and console
+        urgent = lvl in ('WARN', 'ERROR')
+        # Attributes read more than once below, bound to locals
+        ui = self.ui
+        rich = self.rich_console
         
-        # Send to GUI if available
-        if self.ui:
-            self.ui.enqueue(('log', level.lower(), line))
+        # Send to GUI if available (unless the UI currently filters this level out)
+        if ui:
+            tag = level.lower()
+            if getattr(ui, 'level_mask', LEVEL_MASK_ALL) & LEVEL_BITS.get(tag, LEVEL_MASK_ALL):
+                ui.enqueue(('log', tag, line))
         
         # Send to Rich console if available and not in GUI mode
-        if self.rich_console and not self.ui:
-            if verbose and not self._verbose_enabled:
-                return  # Skip verbose messages if verbosity is off
-            
-            if verbose:
-                # Verbose/debug path
-                if hasattr(self.rich_console, 'log_verbose'):
-                    self.rich_console.log_verbose(msg)
-                else:
-                    self.rich_console.log_info(msg)
-            elif level.upper() == 'INFO':
-                self.rich_console.log_info(msg)
-            elif level.upper() == 'SUCCESS':
-                self.rich_console.log_success(msg)
-            elif level.upper() == 'WARN':
-                self.rich_console.log_warning(msg)
-            elif level.upper() == 'ERROR':
-                self.rich_console.log_error(msg)
-            else:
-                self.rich_console.log_info(msg)
-        elif not self.ui and not self.rich_console:
-            # Fallback to plain console with optional ANSI colors
+        console = None
+        if rich and not ui:
+            self._write_file(data, flush=urgent)
+            # Verbose/debug lines use the verbose sink whatever their level
+            dispatch = self._rich_dispatch
+            dispatch.get('VERBOSE' if verbose else lvl, dispatch['INFO'])(msg)
+            return
+        elif self._console:
+            # Fallback to plain console with optional ANSI colors; the writer
+            # thread prints it together with the file write
+            out = self._out
             if self._ansi_enabled:
-                pal = self._palette
-                lvl = level.upper()
-                lvl_color = pal.get(lvl, pal['INFO'])
-                ts_end = line.find(']') + 1 if ']' in line else 0
-                ts_part = line[:ts_end]
-                rest = line[ts_end:]
-                # Color timestamp dim, level token colored, rest muted for VERBOSE
-                colored = f"{pal['DIM']}{ts_part}{pal['RESET']}"
-                # Replace first [LEVEL] occurrence with colored version
-                if f"[{lvl}]" in rest:
-                    rest = rest.replace(f"[{lvl}]", f"[{lvl_color}{lvl}{pal['RESET']}]")
-                if lvl == 'VERBOSE':
-                    rest = f"{pal['VERBOSE']}{rest}{pal['RESET']}"
-                elif lvl in ('WARN', 'ERROR', 'SUCCESS', 'INFO'):
-                    rest = f"{lvl_color}{rest}{pal['RESET']}"
-                print(colored + rest, end='')
+                tmpls = self._ansi_tmpl
+                entry = tmpls.get(lvl)
+                if entry is None:
+                    entry = tmpls[lvl] = self._ansi_entry(lvl)
+                if out is not None:
+                    # Reuse the encoded line: no second format or encode
+                    head, mid, tail, rest_at = entry[1]
+                    console = b''.join((head, data[:14], mid, data[rest_at:-1], tail))
+                else:
+                    console = entry[0] % (hms, ms, ctx, msg)
             else:
-                print(line, end='')
+                console = data if out is not None else line
+        
+        # Always write to file (warnings and errors are flushed immediately)
+        self._write_file(data, flush=urgent, console=console)
 
     def info(self, msg: str, verbose: bool = False):
         """Log info message"""
@@ -6,12 +6,17 @@ Orchestrator for Holmes VM setup
 
 import os
 import time
+import queue
 import threading
-from typing import List, Tuple, Callable, Any, Optional
+from functools import partial
+from typing import Dict, FrozenSet, List, Callable, Any, Optional, NamedTuple, Sequence, Set, Tuple
 
 from holmes_vm.core.config import Config
 from holmes_vm.core.logger import Logger
 from holmes_vm.utils.notifications import show_notification
+from holmes_vm.utils.executor import get_executor
+from holmes_vm.utils.ps_session import close_sessions
+from holmes_vm.utils.system import ps_quote
 from holmes_vm.installers.base import get_registry
 from holmes_vm.installers.chocolatey import ChocolateyInstaller
 from holmes_vm.installers.powershell import PowerShellInstaller
@@ -21,6 +26,80 @@ from holmes_vm.installers.functions import (
     CreateShortcutInstaller, DisableDefenderInstaller
 )
 
+# Upper bound on steps running at the same time inside a parallel batch
+PARALLEL_WORKERS = 4
+
+# Minimum seconds between progress updates sent to the UI
+_PROGRESS_INTERVAL = 0.05
+
+# ETA smoothing: weight of the newest gap between step completions, and the
+# smallest change (seconds) worth showing
+_ETA_ALPHA = 0.3
+_ETA_MIN_CHANGE = 1.0
+
+# Large downloads that get a longer script timeout
+_BIG_TOOLS = frozenset({'ghidra', 'autopsy', 'eztools', 'sysinternals'})
+
+# Tool ID of the Chocolatey bootstrap every package install depends on
+_CHOCO_TOOL_ID = 'choco'
+
+# Steps run phase by phase in this order; unknown phases count as 'install'
+_PHASE_ORDER = {'setup': 0, 'install': 1, 'post_install': 2}
+
+
+class Step(NamedTuple):
+    """A single installation step.
+
+    Adjacent steps marked parallel are run concurrently as one batch.
+    Steps in an earlier phase always finish before a later phase starts.
+    A step is skipped if a step producing one of its requirements failed.
+    """
+    name: str
+    action: Callable
+    parallel: bool = False
+    phase: str = 'install'
+    requires: FrozenSet[str] = frozenset()
+    produces: Optional[str] = None
+
+
+def _schedule(steps: List[Step]) -> List[Step]:
+    """Order steps by phase. Steps within a phase are independent, so the
+    exclusive ones are moved ahead and the parallel ones form one batch.
+    """
+    return sorted(steps, key=lambda s: (_PHASE_ORDER.get(s.phase, 1), s.parallel))
+
+
+def _install_then_shortcut(make_installer: Callable, make_shortcut: Optional[Callable] = None):
+    """Build and run an installer, then best-effort create its desktop shortcut.
+
+    Installers are created here, when the step runs, so steps that never run
+    (cancelled or skipped) cost nothing beyond the factory.
+    """
+    installer = make_installer()
+    if not installer.install():
+        raise RuntimeError(f"{installer.get_name()} failed")
+    if make_shortcut:
+        try:
+            make_shortcut().install()
+        except Exception:
+            pass
+
+
+class _NullUI:
+    """Stand-in UI for console runs; every update is a no-op"""
+
+    def enqueue(self, item):
+        pass
+
+    def enqueue_many(self, items):
+        pass
+
+    def set_eta(self, seconds_remaining):
+        pass
+
+
+_NULL_UI = _NullUI()
+
 
 class SetupOrchestrator:
     """Orchestrates the Holmes VM setup process"""
@@ -30,13 +109,18 @@ class SetupOrchestrator:
         self.logger = logger
         self.args = args
         self.registry = get_registry()
+        # Caps concurrent installs inside a batch; the shared pool may be larger
+        self._parallel_slots = threading.BoundedSemaphore(PARALLEL_WORKERS)
+        # tool_id -> built Step; steps depend only on config and args, so a
+        # later selection reuses them instead of re-resolving installer params
+        self._step_cache: Dict[str, Step] = {}
 
-    def build_steps_from_selection(self, selected_ids: List[str]) -> List[Tuple[str, Callable]]:
+    def build_steps_from_selection(self, selected_ids: List[str]) -> Tuple[Step, ...]:
         """Build installation steps from selected tool IDs"""
-        steps: List[Tuple[str, Callable]] = []
+        steps: List[Step] = []
         # Admin/Windows check is done early in setup.py before UI loads
         prep = PrepareDesktopGroupsInstaller(self.config, self.logger, self.args)
-        steps.append((prep.get_name(), lambda inst=prep: inst.install()))
+        steps.append(Step(prep.get_name(), prep.install, phase='setup'))
 
         for tool_id in selected_ids:
             tool_config = self.config.get_tool_by_id(tool_id)
@@ -51,88 +135,88 @@ class SetupOrchestrator:
                     self.logger.success(f"{tool_name} already installed, skipping.")
                     continue
 
-            installer_type = tool_config.get('installer_type')
-
-            if installer_type == 'function':
-                installer_id = self.config.get_function_installer_id(tool_id)
-                installer = self.registry.get_installer(installer_id, self.config, self.logger, self.args)
-                if installer:
-                    steps.append((installer.get_name(), lambda inst=installer: inst.install()))
-                else:
-                    self.logger.warn(f"Installer not found: {installer_id}")
-
-            elif installer_type == 'chocolatey':
-                choco = self.config.get_choco_params(tool_id) or {}
-                installer = ChocolateyInstaller(
-                    self.config, self.logger, self.args,
-                    choco.get('name'), choco.get('tool_name'), choco.get('version'), choco.get('install_args'), choco.get('suppress_default_args')
-                )
-
-                # Prepare optional shortcut creator
-                desktop_group = tool_config.get('desktop_group')
-                shortcut_installer = None
-                if desktop_group and desktop_group.lower() != 'runtimes':
-                    shortcut_installer = CreateShortcutInstaller(
-                        self.config, self.logger, self.args, tool_id
-                    )
-
-                # Single combined step: install then create shortcut
-                def _do_install_and_shortcut(inst=installer, sc_inst=shortcut_installer):
-                    if not inst.install():
-                        raise RuntimeError(f"{inst.get_name()} failed")
-                    if sc_inst:
-                        try:
-                            sc_inst.install()
-                        except Exception:
-                            pass
-
-                steps.append((installer.get_name(), _do_install_and_shortcut))
-
-            elif installer_type == 'powershell':
-                ps = self.config.get_powershell_params(tool_id) or {}
-                ps_args = ps.get('args', '') or ''
-                if tool_id == 'eztools':
-                    log_dir = getattr(self.args, 'log_dir', None)
-                    if log_dir:
-                        ps_args = (ps_args + f" -LogDir '{log_dir}'").strip()
-
-                desktop_group = tool_config.get('desktop_group')
-                if desktop_group:
-                    shortcut_category = desktop_group
-                    # Place bundle shortcuts in subfolders inside Bundles
-                    if desktop_group.lower() == 'bundles':
-                        shortcut_category = f"{desktop_group}\\{tool_config.get('name')}"
-                    ps_args = (ps_args + f" -ShortcutCategory '{shortcut_category}'").strip()
-
-                # Large downloads get longer timeout (Ghidra, Autopsy, EZ Tools, Sysinternals)
-                big_tools = {'ghidra', 'autopsy', 'eztools', 'sysinternals'}
-                tool_timeout = 600 if tool_id in big_tools else 180
-
-                installer = PowerShellInstaller(
-                    self.config, self.logger, self.args,
-                    ps.get('script_path'), ps.get('function_name'), ps.get('tool_name'), ps_args,
-                    timeout=tool_timeout
-                )
-
-                # Optional second-chance shortcut creation in same step
-                sc_inst = None
-                if desktop_group and desktop_group.lower() != 'runtimes':
-                    sc_inst = CreateShortcutInstaller(
-                        self.config, self.logger, self.args, tool_id
-                    )
-
-                def _do_ps_and_shortcut(inst=installer, sc=sc_inst):
-                    if not inst.install():
-                        raise RuntimeError(f"{inst.get_name()} failed")
-                    if sc:
-                        try:
-                            sc.install()
-                        except Exception:
-                            pass
-
-                steps.append((installer.get_name(), _do_ps_and_shortcut))
-
-        return steps
+            step = self._step_cache.get(tool_id)
+            if step is None:
+                builder = self._STEP_BUILDERS.get(tool_config.get('installer_type'))
+                if builder is None:
+                    continue
+                step = builder(self, tool_id, tool_config)
+                if step is None:
+                    continue
+                self._step_cache[tool_id] = step
+            steps.append(step)
+
+        return tuple(_schedule(steps))
+
+    def _shortcut_factory(self, tool_id: str, tool_config: dict) -> Optional[Callable]:
+        """Shortcut creator factory for tools placed in a desktop group (runtimes get none)"""
+        desktop_group = tool_config.get('desktop_group')
+        if desktop_group and desktop_group.lower() != 'runtimes':
+            return partial(CreateShortcutInstaller, self.config, self.logger, self.args, tool_id)
+        return None
+
+    def _function_step(self, tool_id: str, tool_config: dict) -> Optional[Step]:
+        """Step for a registered Python function installer"""
+        installer_id = self.config.get_function_installer_id(tool_id)
+        installer = self.registry.get_installer(installer_id, self.config, self.logger, self.args)
+        if not installer:
+            self.logger.warn(f"Installer not found: {installer_id}")
+            return None
+        # Prerequisites are tagged 'setup' in the config; the rest tweak
+        # shell and system state after the tools are in place
+        return Step(installer.get_name(), installer.install,
+                    phase=tool_config.get('phase', 'post_install'), produces=tool_id)
+
+    def _chocolatey_step(self, tool_id: str, tool_config: dict) -> Step:
+        """Step installing a Chocolatey package, then its shortcut"""
+        choco = self.config.get_choco_params(tool_id) or {}
+        factory = partial(
+            ChocolateyInstaller, self.config, self.logger, self.args,
+            choco.get('name'), choco.get('tool_name'), choco.get('version'), choco.get('install_args'), choco.get('suppress_default_args')
+        )
+        action = partial(_install_then_shortcut, factory, self._shortcut_factory(tool_id, tool_config))
+        # Chocolatey is not safe to run concurrently, keep these sequential
+        return Step(ChocolateyInstaller.display_name(choco.get('tool_name')), action,
+                    requires=frozenset((_CHOCO_TOOL_ID,)))
+
+    def _powershell_step(self, tool_id: str, tool_config: dict) -> Step:
+        """Step running a PowerShell install script, then its shortcut"""
+        ps = self.config.get_powershell_params(tool_id) or {}
+        ps_args = ps.get('args', '') or ''
+        if tool_id == 'eztools':
+            log_dir = getattr(self.args, 'log_dir', None)
+            if log_dir:
+                ps_args = (ps_args + f" -LogDir {ps_quote(log_dir)}").strip()
+
+        desktop_group = tool_config.get('desktop_group')
+        if desktop_group:
+            shortcut_category = desktop_group
+            # Place bundle shortcuts in subfolders inside Bundles
+            if desktop_group.lower() == 'bundles':
+                shortcut_category = f"{desktop_group}\\{tool_config.get('name')}"
+            ps_args = (ps_args + f" -ShortcutCategory {ps_quote(shortcut_category)}").strip()
+
+        # Large downloads get longer timeout (Ghidra, Autopsy, EZ Tools, Sysinternals)
+        tool_timeout = 600 if tool_id in _BIG_TOOLS else 180
+
+        factory = partial(
+            PowerShellInstaller, self.config, self.logger, self.args,
+            ps.get('script_path'), ps.get('function_name'), ps.get('tool_name'), ps_args,
+            timeout=tool_timeout
+        )
+        # Optional second-chance shortcut creation in same step
+        action = partial(_install_then_shortcut, factory, self._shortcut_factory(tool_id, tool_config))
+        # Download-and-extract scripts can overlap; tools marked exclusive
+        # (choco/msiexec/pip based) must run alone
+        parallel = not tool_config.get('exclusive', False)
+        return Step(PowerShellInstaller.display_name(ps.get('tool_name')), action, parallel)
+
+    # installer_type -> step builder
+    _STEP_BUILDERS = {
+        'function': _function_step,
+        'chocolatey': _chocolatey_step,
+        'powershell': _powershell_step,
+    }
 
     def _is_already_installed(self, tool_id: str, tool_config: dict) -> bool:
         """Check if a tool is already installed by looking for its executable."""
@@ -168,104 +252,173 @@ class SetupOrchestrator:
 
         return False
 
-    def run_steps(self, steps: List[Tuple[str, Callable]], ui=None, cancel_event: Optional[threading.Event] = None) -> int:
+    def skip_if_blocked(self, step: Step, failed: Set[str]) -> bool:
+        """Return True (and log the skip) if a step producing one of this
+        step's requirements is in the failed set.
+        """
+        if step.requires and not step.requires.isdisjoint(failed):
+            self.logger.current_step = step.name
+            self.logger.warn(f"{step.name} skipped: a prerequisite step failed.")
+            return True
+        return False
+
+    def _run_step(self, step: Step, idx: int, total: int,
+                  cancel_event: Optional[threading.Event] = None) -> Optional[bool]:
+        """Run one step with logging. Returns success, or None if cancelled before starting."""
+        if cancel_event and cancel_event.is_set():
+            return None
+        self.logger.current_step = step.name
+        self.logger.info(f"[{idx}/{total}] {step.name}")
+
+        step_start = time.monotonic()
+        try:
+            step.action()
+            step_elapsed = time.monotonic() - step_start
+            self.logger.success(f"{step.name} completed ({step_elapsed:.1f}s).")
+            return True
+        except Exception as e:
+            step_elapsed = time.monotonic() - step_start
+            self.logger.error(f"{step.name} failed ({step_elapsed:.1f}s): {e}")
+            return False
+
+    def _run_parallel_step(self, step: Step, idx: int, total: int,
+                           cancel_event: Optional[threading.Event] = None) -> Optional[bool]:
+        """Run a step from a parallel batch, holding one of the batch slots"""
+        with self._parallel_slots:
+            return self._run_step(step, idx, total, cancel_event)
+
+    def run_steps(self, steps: Sequence[Step], ui=None, cancel_event: Optional[threading.Event] = None) -> int:
         """Run installation steps. Returns number of failures.
 
         Failed steps are skipped automatically so the remaining tools
-        can still be installed.
+        can still be installed. Runs of adjacent parallel steps are
+        executed concurrently on a shared worker pool. Without a UI
+        (plain console mode) progress updates are simply discarded.
         """
         if not steps:
             self.logger.warn('No steps to execute.')
             return 0
+        if ui is None:
+            ui = _NULL_UI
+        enqueue_many, set_eta = ui.enqueue_many, ui.set_eta
 
         total = len(steps)
-        start = time.time()
+        start = time.monotonic()
         failures = 0
-        skipped = 0
-
-        for i, (name, action) in enumerate(steps, start=1):
+        # What failed steps would have produced; dependents are skipped
+        failed: Set[str] = set()
+        done = 0
+        i = 0
+        # Percent complete after n finished steps, computed once
+        percents = tuple(n * 100 // total for n in range(total + 1))
+        last_pct = 0
+        last_progress_t = 0.0
+        # Smoothed wall time between step completions. Step costs vary from
+        # seconds to minutes, and parallel batches complete steps faster than
+        # their own durations suggest, so this tracks the actual pace.
+        gap_ewma: Optional[float] = None
+        last_done_t = start
+        last_eta: Optional[float] = None
+
+        def _send_progress(msgs: list, force: bool = False):
+            # Debounced: quick runs of short steps would otherwise flood the UI
+            nonlocal last_pct, last_progress_t, last_eta
+            now = time.monotonic()
+            pct = percents[done]
+            if pct != last_pct and (force or now - last_progress_t >= _PROGRESS_INTERVAL):
+                msgs.append(('progress_to', pct))
+                last_pct, last_progress_t = pct, now
+            if gap_ewma is not None:
+                eta = gap_ewma * (total - done)
+                if force or last_eta is None or abs(eta - last_eta) > _ETA_MIN_CHANGE:
+                    set_eta(eta)
+                    last_eta = eta
+
+        def _finish(idx: int, success: bool, next_status: Optional[str] = None):
+            nonlocal failures, done, gap_ewma, last_done_t
+            done += 1
+            now = time.monotonic()
+            gap, last_done_t = now - last_done_t, now
+            gap_ewma = gap if gap_ewma is None else _ETA_ALPHA * gap + (1 - _ETA_ALPHA) * gap_ewma
+            if not success:
+                failures += 1
+                if steps[idx - 1].produces:
+                    failed.add(steps[idx - 1].produces)
+            # One queue operation per step completion
+            msgs = [('step_result', idx, success)]
+            _send_progress(msgs, force=done == total)
+            if next_status:
+                msgs.append(('status', next_status))
+            enqueue_many(msgs)
+            # Step boundary: push buffered log lines to disk so a crash loses little
+            self.logger.flush()
+
+        _blocked = partial(self.skip_if_blocked, failed=failed)
+
+        while i < total:
             if cancel_event and cancel_event.is_set():
                 self.logger.warn('Cancelled by user before next step.')
-                skipped = total - i + 1
                 break
 
-            if ui:
-                ui.enqueue(('step_hdr', i, total, name))
-                ui.enqueue(('status', f'[{i}/{total}] {name}'))
-                ui.enqueue(('progress_to', int((i - 1) * 100 / total)))
-
-            self.logger.current_step = name
-            self.logger.info(f"{name}")
-
-            step_start = time.time()
-            success = True
-            try:
-                action()
-                step_elapsed = time.time() - step_start
-                self.logger.success(f"{name} completed ({step_elapsed:.1f}s).")
-            except Exception as e:
-                success = False
-                failures += 1
-                step_elapsed = time.time() - step_start
-                self.logger.error(f"{name} failed ({step_elapsed:.1f}s): {e}")
-                if i < total:
+            # Collect the run of adjacent parallel steps starting here
+            j = i + 1
+            if steps[i].parallel:
+                while j < total and steps[j].parallel:
+                    j += 1
+
+            if j - i == 1:
+                idx, step = i + 1, steps[i]
+                enqueue_many([
+                    ('step_hdr', idx, total, step.name),
+                    ('status', f'[{idx}/{total}] {step.name}'),
+                ])
+                success = not _blocked(step) and self._run_step(step, idx, total)
+                if not success and idx < total:
                     self.logger.info(f"Skipping to next step...")
-
-            if ui:
-                ui.enqueue(('step_result', i, success))
                 # Show what's coming next
-                if i < total:
-                    next_name = steps[i][0]
-                    ui.enqueue(('status', f'Next: {next_name}'))
-
-            done_fraction = i / max(1, total)
-            elapsed = time.time() - start
-            eta = (elapsed / done_fraction) - elapsed if done_fraction > 0 else None
-
-            if ui:
-                ui.set_eta(eta)
-                ui.enqueue(('progress_to', int(i * 100 / total)))
-
-        self.logger.current_step = None
-        elapsed = time.time() - start
-        mm, ss = divmod(int(elapsed), 60)
-        if failures:
-            self.logger.warn(f'{failures}/{total} step(s) failed. Total time: {mm}m {ss}s.')
-        else:
-            self.logger.success(f'All {total} steps completed in {mm}m {ss}s.')
-        self._notify_completion(total, failures)
-        return failures
-
-    def run_steps_console(self, steps: List[Tuple[str, Callable]]) -> int:
-        """Run installation steps in console mode. Returns number of failures.
-
-        Failed steps are skipped automatically.
-        """
-        if not steps:
-            self.logger.warn('No steps to execute.')
-            return 0
-
-        total = len(steps)
-        start = time.time()
-        failures = 0
-
-        for i, (name, action) in enumerate(steps, start=1):
-            self.logger.current_step = name
-            self.logger.info(f"[{i}/{total}] {name}")
-
-            step_start = time.time()
-            try:
-                action()
-                step_elapsed = time.time() - step_start
-                self.logger.success(f"{name} completed ({step_elapsed:.1f}s).")
-            except Exception as e:
-                failures += 1
-                step_elapsed = time.time() - step_start
-                self.logger.error(f"{name} failed ({step_elapsed:.1f}s): {e}")
-                self.logger.info(f"Skipping to next step...")
-
+                _finish(idx, success, f'Next: {steps[idx].name}' if idx < total else None)
+            else:
+                msgs = [('step_hdr', k + 1, total, steps[k].name) for k in range(i, j)]
+                msgs.append(('status', f'[{i + 1}-{j}/{total}] Running {j - i} steps in parallel'))
+                enqueue_many(msgs)
+                runnable = []
+                for k in range(i, j):
+                    if _blocked(steps[k]):
+                        _finish(k + 1, False)
+                    else:
+                        runnable.append(k)
+                self.logger.current_step = None
+                if runnable:
+                    self.logger.info(f"Running {len(runnable)} steps in parallel (up to {PARALLEL_WORKERS} at a time)")
+                results: queue.SimpleQueue = queue.SimpleQueue()
+
+                def _report(k: int):
+                    success = None
+                    try:
+                        success = self._run_parallel_step(steps[k], k + 1, total, cancel_event)
+                    finally:
+                        results.put((k + 1, success))
+
+                executor = get_executor()
+                for k in runnable:
+                    executor.submit(_report, k)
+                for _ in range(len(runnable)):
+                    idx, success = results.get()
+                    if success is None:
+                        continue  # cancelled before it started
+                    _finish(idx, success)
+            i = j
+
+        if done < total:
+            # The last finished step may have been debounced
+            msgs = []
+            _send_progress(msgs, force=True)
+            enqueue_many(msgs)
         self.logger.current_step = None
-        elapsed = time.time() - start
+        # Every step has returned; don't keep idle PowerShell hosts alive
+        # while the finished UI stays open
+        close_sessions()
+        elapsed = time.monotonic() - start
         mm, ss = divmod(int(elapsed), 60)
         if failures:
             self.logger.warn(f'{failures}/{total} step(s) failed. Total time: {mm}m {ss}s.')
@@ -4,26 +4,29 @@
 Base installer class and registry for Holmes VM tools
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Type
+from typing import Optional, Dict, Any, Tuple, Type
 from holmes_vm.core.logger import Logger
 from holmes_vm.core.config import Config
 
 
-class BaseInstaller(ABC):
-    """Base class for all installers"""
+class BaseInstaller:
+    """Base class for all installers.
+
+    Subclasses must override install() and get_name(). A plain class (no ABC
+    metaclass) keeps instantiation cheap.
+    """
+
+    __slots__ = ('config', 'logger', 'args')
     
     def __init__(self, config: Config, logger: Logger, args: Any):
         self.config = config
         self.logger = logger
         self.args = args
     
-    @abstractmethod
     def install(self) -> bool:
         """Execute installation. Returns True on success, False on failure"""
         raise NotImplementedError
     
-    @abstractmethod
     def get_name(self) -> str:
         """Get installer name"""
         raise NotImplementedError
@@ -39,20 +42,32 @@ class BaseInstaller(ABC):
 
 class InstallerRegistry:
     """Registry of available installers"""
+
+    __slots__ = ('_installers', '_instances')
     
     def __init__(self):
         self._installers: Dict[str, Type[BaseInstaller]] = {}
+        # Installers built from (config, logger, args) alone hold no other
+        # state, so one instance per id and context is shared. Keys use id()
+        # (args namespaces are unhashable); the cached instance references
+        # the same objects, so those ids cannot be reused while it is cached.
+        self._instances: Dict[Tuple[str, int, int, int], BaseInstaller] = {}
     
     def register(self, installer_id: str, installer_class: Type[BaseInstaller]):
         """Register an installer"""
         self._installers[installer_id] = installer_class
+        self._instances.clear()
     
     def get_installer(self, installer_id: str, config: Config, logger: Logger, args: Any) -> Optional[BaseInstaller]:
-        """Get an installer instance"""
-        installer_class = self._installers.get(installer_id)
-        if installer_class:
-            return installer_class(config, logger, args)
-        return None
+        """Get an installer instance (shared per id, config, logger and args)"""
+        key = (installer_id, id(config), id(logger), id(args))
+        installer = self._instances.get(key)
+        if installer is None:
+            installer_class = self._installers.get(installer_id)
+            if installer_class is None:
+                return None
+            installer = self._instances[key] = installer_class(config, logger, args)
+        return installer
     
     def list_installers(self):
         """List all registered installers"""
@@ -6,13 +6,15 @@ Chocolatey package installer
 
 from typing import Optional
 from .base import BaseInstaller, register_installer
-from ..utils.system import run_powershell_streamed, import_common_module_and
+from ..utils.system import run_powershell_streamed, import_common_module_and, ps_quote
 
 
 @register_installer('chocolatey')
 class ChocolateyInstaller(BaseInstaller):
     """Installer for Chocolatey packages"""
 
+    __slots__ = ('package_name', 'tool_name', 'version', 'install_args', 'suppress_default_args')
+
     def __init__(self, config, logger, args, package_name: str, tool_name: str, version: Optional[str] = None, install_args: Optional[str] = None, suppress_default_args: bool = False):
         super().__init__(config, logger, args)
         self.package_name = package_name
@@ -21,27 +23,37 @@ class ChocolateyInstaller(BaseInstaller):
         self.install_args = install_args
         self.suppress_default_args = suppress_default_args
 
+    @staticmethod
+    def display_name(tool_name: str) -> str:
+        """Step name for a package, available without building the installer"""
+        return f"Install {tool_name}"
+
     def get_name(self) -> str:
-        return f"Install {self.tool_name}"
+        return self.display_name(self.tool_name)
 
-    def install(self) -> bool:
-        """Install Chocolatey package with live progress output"""
-        self.logger.info(f'Installing {self.tool_name} via Chocolatey...')
+    def build_command(self) -> str:
+        """Install-ChocoPackage call for this package (Holmes.Common must be loaded).
 
-        args = f"-Name '{self.package_name}'"
+        Parameters are passed by splatting a hashtable of literal values, so
+        package names and install arguments are never re-parsed as code.
+        """
+        params = [('Name', self.package_name)]
         if self.version:
-            args += f" -Version '{self.version}'"
+            params.append(('Version', self.version))
+        if self.install_args:
+            params.append(('InstallArguments', self.install_args))
+        entries = [f"{key} = {ps_quote(value)}" for key, value in params]
         if self.should_force_reinstall():
-            args += ' -ForceReinstall'
+            entries.append('ForceReinstall = $true')
         if self.is_what_if_mode():
-            args += ' -WhatIf'
-        if self.install_args:
-            args += f" -InstallArguments '{self.install_args}'"
+            entries.append('WhatIf = $true')
+        return f"$p = @{{ {'; '.join(entries)} }}; Install-ChocoPackage @p"
+
+    def install(self) -> bool:
+        """Install Chocolatey package with live progress output"""
+        self.logger.info(f'Installing {self.tool_name} via Chocolatey...')
 
-        code = import_common_module_and(
-            f"Install-ChocoPackage {args}",
-            self.config.module_path
-        )
+        code = import_common_module_and(self.build_command(), self.config.module_path)
 
         res = run_powershell_streamed(code, logger=self.logger)
 
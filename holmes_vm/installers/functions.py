@@ -7,18 +7,59 @@ Function-based installers (Python implementations)
 import os
 import re
 import sys
+import functools
 import shutil
 import subprocess
 import urllib.request
+from concurrent.futures import as_completed
 from typing import Optional, List, Dict, Tuple
 from holmes_vm.installers.base import BaseInstaller, register_installer
-from holmes_vm.utils.system import run_powershell, run_powershell_streamed, import_common_module_and
+from holmes_vm.utils.system import (
+    run_powershell, run_powershell_streamed, import_common_module_and, copy_file, ps_quote
+)
+from holmes_vm.utils.executor import get_executor
+from holmes_vm.utils import step_cache
+
+# Fixed install locations
+TOOLS_DIR = r'C:\Tools'
+WALLPAPER_NAME = 'wallpaper.jpg'
+WALLPAPER_DEST_DIR = os.path.join(TOOLS_DIR, 'Wallpapers')
+WALLPAPER_DEST = os.path.join(WALLPAPER_DEST_DIR, 'holmes-wallpaper.jpg')
+
+# A successful network check is trusted for this long on re-runs (seconds)
+NETWORK_CHECK_TTL = 600
+
+# Binds $shell to a WScript.Shell COM object created once per pooled
+# PowerShell session and reused by every later shortcut command
+_PS_WSH = (
+    "if (-not $global:HolmesWsh) { $global:HolmesWsh = New-Object -ComObject WScript.Shell }; "
+    "$shell = $global:HolmesWsh; "
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _lenient_opener() -> urllib.request.OpenerDirector:
+    """URL opener tolerating SSL cert issues on fresh VMs with outdated root CAs.
+
+    Built once and shared, so the SSL context and handler chain are not
+    recreated for every probe.
+    """
+    import ssl
+    ctx = ssl.create_default_context()
+    try:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    except Exception:
+        return urllib.request.build_opener()
+    return urllib.request.build_opener(urllib.request.HTTPSHandler(context=ctx))
 
 
 @register_installer('prepare_desktop_groups')
 class PrepareDesktopGroupsInstaller(BaseInstaller):
     """Create category desktop group folders at start so shortcuts land directly there."""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Prepare Desktop category folders"
 
@@ -62,43 +103,56 @@ class PrepareDesktopGroupsInstaller(BaseInstaller):
 class NetworkCheckInstaller(BaseInstaller):
     """Network connectivity check"""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Network connectivity"
 
     def install(self) -> bool:
         """Check network connectivity (tolerates SSL cert issues on fresh VMs)"""
-        import ssl
         self.logger.info('Checking network connectivity...')
 
         urls = ['https://www.google.com/generate_204', 'https://github.com']
+        fp = step_cache.fingerprint(*urls)
+        if not self.should_force_reinstall() \
+                and step_cache.is_done('network_check', fp, max_age=NETWORK_CHECK_TTL):
+            self.logger.success('Network was reachable on a recent run, skipping check.')
+            return True
         ok = 0
-
-        # Create a lenient SSL context for fresh VMs with outdated root CAs
-        ctx = ssl.create_default_context()
-        try:
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-        except Exception:
-            ctx = None
-
-        for url in urls:
+        opener = _lenient_opener()
+
+        def _probe(url):
+            with opener.open(url, timeout=7) as resp:  # nosec B310
+                return resp.status
+
+        # Probe all URLs concurrently (overlapping TLS handshakes); results are
+        # logged from this thread so they keep the step context
+        executor = get_executor()
+        futures = {executor.submit(_probe, url): url for url in urls}
+        for future in as_completed(futures):
+            url = futures[future]
             try:
-                with urllib.request.urlopen(url, timeout=7, context=ctx) as resp:  # nosec B310
-                    if 200 <= resp.status < 400:
-                        ok += 1
-                        self.logger.success(f'Reachable: {url}')
-                    else:
-                        self.logger.warn(f'Unexpected status {resp.status} for {url}')
+                status = future.result()
             except Exception as e:
                 self.logger.warn(f'Not reachable: {url} ({e})')
+                continue
+            if 200 <= status < 400:
+                ok += 1
+                self.logger.success(f'Reachable: {url}')
+            else:
+                self.logger.warn(f'Unexpected status {status} for {url}')
 
         self.logger.info(f'Network connectivity summary: {ok}/{len(urls)} reachable')
+        if ok:
+            step_cache.mark_done('network_check', fp)
         return ok > 0
 
 
 @register_installer('ensure_choco')
 class ChocolateySetupInstaller(BaseInstaller):
     """Ensure Chocolatey is installed"""
+
+    __slots__ = ()
     
     def get_name(self) -> str:
         return "Ensure Chocolatey"
@@ -106,75 +160,125 @@ class ChocolateySetupInstaller(BaseInstaller):
     def install(self) -> bool:
         """Ensure Chocolatey is installed"""
         self.logger.info('Ensuring Chocolatey...')
-        
+
+        # Skip the PowerShell round trip when an earlier run already
+        # bootstrapped Chocolatey with the same common module
+        fp = step_cache.file_fingerprint(self.config.module_path)
+        if not self.should_force_reinstall() and self._choco_present() \
+                and step_cache.is_done('ensure_choco', fp):
+            self.logger.success('Chocolatey is ready.')
+            return True
+
         code = import_common_module_and('Ensure-Chocolatey', self.config.module_path)
-        res = run_powershell(code)
+        # Bootstrap downloads and installs Chocolatey; stream its progress live
+        res = run_powershell_streamed(code, logger=self.logger)
         
         if res.returncode != 0:
             self.logger.warn(f"Chocolatey setup returned {res.returncode}: {res.stderr.strip()}")
             return False
         else:
+            if not self.is_what_if_mode():
+                step_cache.mark_done('ensure_choco', fp)
             self.logger.success('Chocolatey is ready.')
             return True
 
+    @staticmethod
+    def _choco_present() -> bool:
+        if shutil.which('choco'):
+            return True
+        base = os.environ.get('ProgramData', r'C:\ProgramData')
+        return os.path.isfile(os.path.join(base, 'chocolatey', 'bin', 'choco.exe'))
+
 
 @register_installer('upgrade_pip')
 class PipUpgradeInstaller(BaseInstaller):
     """Upgrade pip and core Python tools"""
+
+    __slots__ = ()
+
+    _TOOLS = ('pip', 'setuptools', 'wheel', 'pipx', 'virtualenv')
     
     def get_name(self) -> str:
         return "Upgrade pip/setuptools/wheel"
     
+    def _pip_install(self, packages) -> int:
+        """Run one `pip install -U`, streaming its output to the log; returns the exit code"""
+        proc = subprocess.Popen(
+            [sys.executable, '-m', 'pip', '--disable-pip-version-check', '--no-input',
+             'install', '-U', '--progress-bar', 'off', *packages],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+            env=dict(os.environ, PIP_DISABLE_PIP_VERSION_CHECK='1', PIP_NO_INPUT='1')
+        )
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line:
+                self.logger.info(f'  {line}', verbose=True)
+        return proc.wait()
+
     def install(self) -> bool:
         """Upgrade pip and core tools"""
         self.logger.info('Upgrading pip and core tools...')
-        
+
         try:
-            subprocess.run(
-                [sys.executable, '-m', 'pip', 'install', '-U', 'pip', 'setuptools', 'wheel'],
-                check=False, capture_output=True, text=True
-            )
-            subprocess.run(
-                [sys.executable, '-m', 'pip', 'install', '-U', 'pipx', 'virtualenv'],
-                check=False, capture_output=True, text=True
-            )
-            self.logger.success('Pip and core tools upgraded.')
-            return True
+            # One pip run (one interpreter start, one resolver pass) for all tools;
+            # output is streamed to the log instead of being buffered in memory
+            rc = self._pip_install(self._TOOLS)
+            if rc != 0:
+                # Upgrading pip in the same run as its dependents can trip the
+                # resolver; retry with pip on its own first
+                self.logger.info(f'Combined pip upgrade returned {rc}, retrying in two passes...')
+                rc = self._pip_install(self._TOOLS[:1]) or self._pip_install(self._TOOLS[1:])
         except Exception as e:
             self.logger.warn(f'pip upgrade failed: {e}')
             return False
+        if rc != 0:
+            self.logger.warn(f'pip upgrade returned {rc}')
+            return False
+        self.logger.success('Pip and core tools upgraded.')
+        return True
 
 
 @register_installer('install_wallpaper')
 class WallpaperInstaller(BaseInstaller):
     """Install and apply wallpaper"""
+
+    __slots__ = ()
     
     def get_name(self) -> str:
         return "Copy and apply wallpaper"
     
     def install(self) -> bool:
         """Copy and apply wallpaper"""
-        src = os.path.join(self.config.assets_dir, 'wallpaper.jpg')
+        src = os.path.join(self.config.assets_dir, WALLPAPER_NAME)
         
         if not os.path.exists(src):
             self.logger.warn('Wallpaper not found in assets; skipping.')
             return False
         
-        dest_dir = r'C:\Tools\Wallpapers'
-        os.makedirs(dest_dir, exist_ok=True)
-        dest = os.path.join(dest_dir, 'holmes-wallpaper.jpg')
+        os.makedirs(WALLPAPER_DEST_DIR, exist_ok=True)
+        dest = WALLPAPER_DEST
         
         try:
-            shutil.copyfile(src, dest)
-            self.logger.success(f'Wallpaper copied to {dest}')
-        except Exception as e:
-            self.logger.warn(f'Failed to copy wallpaper: {e}')
-            return False
+            # Same size and not older than the asset: a previous run copied it
+            s, d = os.stat(src), os.stat(dest)
+            up_to_date = s.st_size == d.st_size and d.st_mtime >= s.st_mtime
+        except OSError:
+            up_to_date = False
+
+        if up_to_date:
+            self.logger.info(f'Wallpaper already present at {dest}')
+        else:
+            try:
+                copy_file(src, dest)
+                self.logger.success(f'Wallpaper copied to {dest}')
+            except Exception as e:
+                self.logger.warn(f'Failed to copy wallpaper: {e}')
+                return False
         
         # Apply wallpaper
         self.logger.info('Applying wallpaper...')
         code = import_common_module_and(
-            f"Set-Wallpaper -ImagePath '{dest}' -Style Fill",
+            f"Set-Wallpaper -ImagePath {ps_quote(dest)} -Style Fill",
             self.config.module_path
         )
         res = run_powershell(code)
@@ -191,6 +295,8 @@ class WallpaperInstaller(BaseInstaller):
 class AppearanceInstaller(BaseInstaller):
     """Apply Windows appearance settings with Sherlock Holmes dark theme and forensics personalization"""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Apply Windows appearance (Dark Mode + Personalization)"
 
@@ -199,10 +305,16 @@ class AppearanceInstaller(BaseInstaller):
         self.logger.info('Applying Sherlock Holmes dark theme...')
 
         # Victorian brown accent color: #A0826D
-        code = import_common_module_and(
-            "Set-WindowsAppearance -DarkMode -AccentHex '#A0826D' -ShowAccentOnTaskbar -EnableTransparency -ApplyForAllUsers",
-            self.config.module_path
+        theme_cmd = "Set-WindowsAppearance -DarkMode -AccentHex '#A0826D' -ShowAccentOnTaskbar -EnableTransparency -ApplyForAllUsers"
+        tweaks_cmd = "Set-ForensicsPersonalization -RestartExplorer"
+        fp = step_cache.fingerprint(
+            step_cache.file_fingerprint(self.config.module_path), theme_cmd, tweaks_cmd
         )
+        if not self.should_force_reinstall() and step_cache.is_done('set_appearance', fp):
+            self.logger.success('Appearance already applied on an earlier run, skipping.')
+            return True
+
+        code = import_common_module_and(theme_cmd, self.config.module_path)
         res = run_powershell_streamed(code, logger=self.logger)
 
         if res.returncode != 0:
@@ -212,10 +324,7 @@ class AppearanceInstaller(BaseInstaller):
 
         # Deep personalization: taskbar, explorer, system, privacy, visual polish
         self.logger.info('Applying forensics VM personalization tweaks...')
-        code2 = import_common_module_and(
-            "Set-ForensicsPersonalization -RestartExplorer",
-            self.config.module_path
-        )
+        code2 = import_common_module_and(tweaks_cmd, self.config.module_path)
         res2 = run_powershell_streamed(code2, logger=self.logger)
 
         if res2.returncode != 0:
@@ -224,6 +333,8 @@ class AppearanceInstaller(BaseInstaller):
         else:
             self.logger.success('Forensics VM personalization applied (taskbar, explorer, system, privacy, visual).')
 
+        if res.returncode == 0 and res2.returncode == 0 and not self.is_what_if_mode():
+            step_cache.mark_done('set_appearance', fp)
         return True
 
 
@@ -231,6 +342,8 @@ class AppearanceInstaller(BaseInstaller):
 class DisableDefenderInstaller(BaseInstaller):
     """Disable Windows Defender for forensics VM (prevents interference with malware samples)"""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Disable Windows Defender (Forensics VM)"
 
@@ -268,6 +381,8 @@ class DisableDefenderInstaller(BaseInstaller):
 @register_installer('pin_taskbar')
 class PinTaskbarInstaller(BaseInstaller):
     """Pin application to taskbar"""
+
+    __slots__ = ('path', 'tool_name')
     
     def __init__(self, config, logger, args, path: str, tool_name: str):
         super().__init__(config, logger, args)
@@ -282,7 +397,7 @@ class PinTaskbarInstaller(BaseInstaller):
         self.logger.info(f'Pinning {self.tool_name} to taskbar...')
         
         code = import_common_module_and(
-            f"Pin-TaskbarItem -Path '{self.path}'",
+            f"Pin-TaskbarItem -Path {ps_quote(self.path)}",
             self.config.module_path
         )
         res = run_powershell(code)
@@ -299,6 +414,8 @@ class PinTaskbarInstaller(BaseInstaller):
 class OrganizeDesktopInstaller(BaseInstaller):
     """Organize Desktop shortcuts into folders per category"""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Organize Desktop shortcuts"
 
@@ -469,6 +586,8 @@ class OrganizeDesktopInstaller(BaseInstaller):
 class ExplorerForensicTweaksInstaller(BaseInstaller):
     """Apply Explorer settings for forensic analysis readiness."""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Explorer forensic tweaks"
 
@@ -524,6 +643,8 @@ class ExplorerForensicTweaksInstaller(BaseInstaller):
 class DisableDefenderSubmitInstaller(BaseInstaller):
     """Disable Windows Defender automatic sample submission."""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Disable Defender sample submission"
 
@@ -555,6 +676,8 @@ class DisableDefenderSubmitInstaller(BaseInstaller):
 class SetTimezoneUTCInstaller(BaseInstaller):
     """Set system timezone to UTC (forensic best practice)."""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Set timezone to UTC"
 
@@ -582,6 +705,8 @@ class SetTimezoneUTCInstaller(BaseInstaller):
 class DisableSleepScreensaverInstaller(BaseInstaller):
     """Disable sleep, screen timeout, and screensaver."""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Disable sleep & screensaver"
 
@@ -615,6 +740,8 @@ class DisableSleepScreensaverInstaller(BaseInstaller):
 class DisableHibernationInstaller(BaseInstaller):
     """Disable hibernation to free disk space."""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Disable hibernation"
 
@@ -642,6 +769,8 @@ class DisableHibernationInstaller(BaseInstaller):
 class EnableLongPathsInstaller(BaseInstaller):
     """Enable Win32 long path support (>260 chars)."""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Enable Win32 long paths"
 
@@ -670,13 +799,15 @@ class EnableLongPathsInstaller(BaseInstaller):
 class CreateToolsDirectoryInstaller(BaseInstaller):
     """Create C:\\Tools directory structure and add to PATH."""
 
+    __slots__ = ()
+
     def get_name(self) -> str:
         return "Create C:\\Tools structure"
 
     def install(self) -> bool:
         self.logger.info('Creating C:\\Tools directory structure...')
 
-        base = r'C:\Tools'
+        base = TOOLS_DIR
         subdirs = [
             'Malware', 'Memory', 'Disk', 'Network', 'Logs',
             'Documents', 'Hashing', 'Wallpapers', 'YARA-Rules',
@@ -718,6 +849,8 @@ class CreateShortcutInstaller(BaseInstaller):
     This runs after each tool is installed, not at the end.
     """
 
+    __slots__ = ('tool_id',)
+
     def __init__(self, config, logger, args, tool_id: str):
         super().__init__(config, logger, args)
         self.tool_id = tool_id
@@ -741,14 +874,8 @@ class CreateShortcutInstaller(BaseInstaller):
         lnk = os.path.join(shortcut_dir, f"{base}.lnk")
         wd = working_dir or os.path.dirname(target)
         
-        # Escape single quotes in paths for PowerShell
-        target_escaped = target.replace("'", "''")
-        lnk_escaped = lnk.replace("'", "''")
-        wd_escaped = wd.replace("'", "''")
-        base_escaped = base.replace("'", "''")
-        
         code = import_common_module_and(
-            f"$shell=New-Object -ComObject WScript.Shell; $lnk='{lnk_escaped}'; $sc=$shell.CreateShortcut($lnk); $sc.TargetPath='{target_escaped}'; $sc.WorkingDirectory='{wd_escaped}'; $sc.WindowStyle=1; $sc.Description='{base_escaped}'; $sc.Save()",
+            _PS_WSH + f"$lnk={ps_quote(lnk)}; $sc=$shell.CreateShortcut($lnk); $sc.TargetPath={ps_quote(target)}; $sc.WorkingDirectory={ps_quote(wd)}; $sc.WindowStyle=1; $sc.Description={ps_quote(base)}; $sc.Save()",
             self.config.module_path
         )
         if self.is_what_if_mode():
@@ -763,13 +890,8 @@ class CreateShortcutInstaller(BaseInstaller):
         return ok
 
     def _ps_shortcuts_from_folder(self, folder: str, dest: str, filter_pat: str = '*.exe') -> bool:
-        # Escape single quotes for PowerShell
-        folder_escaped = folder.replace("'", "''")
-        dest_escaped = dest.replace("'", "''")
-        filter_escaped = filter_pat.replace("'", "''")
-        
         code = import_common_module_and(
-            f"New-ShortcutsFromFolder -Folder '{folder_escaped}' -Filter '{filter_escaped}' -ShortcutDir '{dest_escaped}' -WorkingDir '{folder_escaped}'",
+            f"New-ShortcutsFromFolder -Folder {ps_quote(folder)} -Filter {ps_quote(filter_pat)} -ShortcutDir {ps_quote(dest)} -WorkingDir {ps_quote(folder)}",
             self.config.module_path
         )
         if self.is_what_if_mode():
@@ -894,13 +1016,12 @@ class CreateShortcutInstaller(BaseInstaller):
                         priority_dirs.append(folder)
                 
                 if priority_dirs:
-                    dirs_escaped = [d.replace("'", "''") for d in priority_dirs]
-                    dirs_str = "', '".join(dirs_escaped)
-                    dest_escaped = dest_dir.replace("'", "''")
-                    filter_escaped = filter_pat.replace("'", "''")
+                    dirs_str = ', '.join(ps_quote(d) for d in priority_dirs)
+                    dest_quoted = ps_quote(dest_dir)
+                    filter_quoted = ps_quote(filter_pat)
                     
                     code = import_common_module_and(
-                        f"$priorityDirs = @('{dirs_str}'); $seen = @{{}}; $shell = New-Object -ComObject WScript.Shell; foreach ($dir in $priorityDirs) {{ Get-ChildItem -Path $dir -Recurse -Filter '{filter_escaped}' -File -ErrorAction SilentlyContinue | ForEach-Object {{ $name = $_.Name; if (-not $seen.ContainsKey($name)) {{ $lnk = Join-Path '{dest_escaped}' ($name -replace '\\.exe$', '') + '.lnk'; $sc = $shell.CreateShortcut($lnk); $sc.TargetPath = $_.FullName; $sc.WorkingDirectory = $_.Directory.FullName; $sc.WindowStyle = 1; $sc.Description = $_.BaseName; $sc.Save(); $seen[$name] = $true }} }} }}",
+                        _PS_WSH + f"$priorityDirs = @({dirs_str}); $seen = @{{}}; foreach ($dir in $priorityDirs) {{ Get-ChildItem -Path $dir -Recurse -Filter {filter_quoted} -File -ErrorAction SilentlyContinue | ForEach-Object {{ $name = $_.Name; if (-not $seen.ContainsKey($name)) {{ $lnk = Join-Path {dest_quoted} ($name -replace '\\.exe$', '') + '.lnk'; $sc = $shell.CreateShortcut($lnk); $sc.TargetPath = $_.FullName; $sc.WorkingDirectory = $_.Directory.FullName; $sc.WindowStyle = 1; $sc.Description = $_.BaseName; $sc.Save(); $seen[$name] = $true }} }} }}",
                         self.config.module_path
                     )
                     if not self.is_what_if_mode():
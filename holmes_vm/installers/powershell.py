@@ -13,6 +13,8 @@ from ..utils.system import run_powershell_streamed, import_common_module_and, do
 class PowerShellInstaller(BaseInstaller):
     """Installer that runs PowerShell scripts"""
 
+    __slots__ = ('script_path', 'function_name', 'tool_name', 'ps_args', 'timeout')
+
     def __init__(self, config, logger, args, script_path: str, function_name: str, tool_name: str, ps_args: str = '', timeout: int = 180):
         super().__init__(config, logger, args)
         self.script_path = script_path
@@ -21,8 +23,10 @@ class PowerShellInstaller(BaseInstaller):
         self.ps_args = ps_args
         self.timeout = timeout
 
-    def get_name(self) -> str:
-        name = self.tool_name or ''
+    @staticmethod
+    def display_name(tool_name: str) -> str:
+        """Step name for a script, available without building the installer"""
+        name = tool_name or ''
         lower = name.lower()
         action_verbs = ('install', 'uninstall', 'remove', 'upgrade', 'update',
                         'enable', 'disable', 'set', 'configure', 'create', 'ensure')
@@ -30,6 +34,9 @@ class PowerShellInstaller(BaseInstaller):
             return name
         return f"Install {name}"
 
+    def get_name(self) -> str:
+        return self.display_name(self.tool_name)
+
     def install(self) -> bool:
         """Run PowerShell installer script with live progress output"""
         self.logger.info(f'Installing {self.tool_name}...')
@@ -13,30 +13,6 @@ from holmes_vm.core.config import get_config
 from holmes_vm.core.logger import create_logger, get_default_log_dir
 from holmes_vm.core.orchestrator import SetupOrchestrator
 
-# Try to import Modern CustomTkinter UI first
-try:
-    from holmes_vm.ui.modern_window import ModernUI, is_ctk_available
-    CTK_SUPPORT = is_ctk_available()
-except ImportError:
-    CTK_SUPPORT = False
-    ModernUI = None
-
-# Fallback to original tkinter UI
-try:
-    from holmes_vm.ui.window import UI, is_tk_available
-    TK_SUPPORT = is_tk_available()
-except ImportError:
-    TK_SUPPORT = False
-    UI = None
-
-# Try to import Rich console
-try:
-    from holmes_vm.ui.rich_console import RichConsoleUI, is_rich_available
-    RICH_SUPPORT = is_rich_available()
-except ImportError:
-    RICH_SUPPORT = False
-    RichConsoleUI = None
-
 
 APP_NAME = "Holmes VM Setup"
 
@@ -58,19 +34,38 @@ def _select_ui(args):
     """Select and initialize the best available UI based on args and availability.
     Returns (ui, rich_ui, use_gui_flag)
     """
+    # UI modules are imported only for the branch that uses them, so console
+    # runs never load tkinter / customtkinter
     if not args.no_gui:
-        if CTK_SUPPORT:
+        # Try the modern CustomTkinter UI first
+        try:
+            from holmes_vm.ui.modern_window import ModernUI, is_ctk_available
+            ctk_support = is_ctk_available()
+        except ImportError:
+            ctk_support = False
+        if ctk_support:
             try:
                 return ModernUI(APP_NAME), None, True
             except Exception as e:
                 print(f"Warning: Could not initialize modern UI: {e}")
-        if TK_SUPPORT:
+        # Fallback to original tkinter UI
+        try:
+            from holmes_vm.ui.window import UI, is_tk_available
+            tk_support = is_tk_available()
+        except ImportError:
+            tk_support = False
+        if tk_support:
             try:
                 return UI(APP_NAME), None, True
             except Exception as e:
                 print(f"Warning: Could not initialize Tk UI: {e}")
     # Console fallbacks
-    if RICH_SUPPORT:
+    try:
+        from holmes_vm.ui.rich_console import RichConsoleUI, is_rich_available
+        rich_support = is_rich_available()
+    except ImportError:
+        rich_support = False
+    if rich_support:
         try:
             rich = RichConsoleUI(APP_NAME)
             rich.show_banner()
@@ -159,15 +154,24 @@ def main() -> int:
 
         total = len(steps)
         failures = 0
-        for i, (name, action) in enumerate(steps, start=1):
+        # What failed steps would have produced; dependents are skipped
+        failed = set()
+        for i, step in enumerate(steps, start=1):
+            name = step.name
             rich_ui.start_step(i, total, name)
             logger.current_step = name
 
+            if orchestrator.skip_if_blocked(step, failed):
+                failures += 1
+                rich_ui.complete_step(success=False)
+                continue
             try:
-                action()
+                step.action()
                 rich_ui.complete_step(success=True)
             except Exception as e:
                 failures += 1
+                if step.produces:
+                    failed.add(step.produces)
                 logger.error(f"{name} failed: {e}")
                 rich_ui.complete_step(success=False)
 
@@ -184,7 +188,7 @@ def main() -> int:
             logger.warn('No default tools found in configuration.')
             return 1
         steps = orchestrator.build_steps_from_selection(selected_ids)
-        orchestrator.run_steps_console(steps)
+        orchestrator.run_steps(steps)
 
     logger.success('Setup finished.')
     return 0
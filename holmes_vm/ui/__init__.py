@@ -1,13 +1,30 @@
 """UI components for Holmes VM setup"""
 
-from holmes_vm.ui.window import UI, is_tk_available
+# Submodules load on first attribute access (PEP 562), so importing
+# holmes_vm.ui.colors from the console paths does not pull in tkinter
+
+_WINDOW_NAMES = ('UI', 'is_tk_available')
+_RICH_NAMES = ('RichConsoleUI', 'is_rich_available', 'RICH_AVAILABLE')
+
+
+def __getattr__(name):
+    if name in _WINDOW_NAMES:
+        from holmes_vm.ui import window
+        return getattr(window, name)
+    if name in _RICH_NAMES:
+        try:
+            from holmes_vm.ui import rich_console
+        except ImportError:
+            if name == 'RICH_AVAILABLE':
+                return False
+            if name == 'RichConsoleUI':
+                return None
+            raise
+        if name == 'RICH_AVAILABLE':
+            return rich_console.is_rich_available()
+        return getattr(rich_console, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-try:
-    from holmes_vm.ui.rich_console import RichConsoleUI, is_rich_available
-    RICH_AVAILABLE = is_rich_available()
-except ImportError:
-    RICH_AVAILABLE = False
-    RichConsoleUI = None
 
 __all__ = [
     'UI',
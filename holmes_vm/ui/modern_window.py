@@ -5,7 +5,10 @@ Modern UI window for Holmes VM Setup using CustomTkinter
 Beautiful, native-looking interface with proper scrolling and visibility
 """
 
+import collections
+import itertools
 import queue
+import threading
 import time
 from typing import List, Dict, Any, Callable, Optional
 
@@ -20,10 +23,17 @@ except ImportError:
 import tkinter as tk
 
 from .colors import *
+from holmes_vm.core.logger import LEVEL_BITS
 
 
 class ModernUI:
     """Modern UI window for Holmes VM setup with CustomTkinter"""
+
+    # Queue polling interval bounds (ms); see _process_queue
+    _POLL_MIN_MS = 20
+    _POLL_MAX_MS = 250
+    # Maximum queued UI items
+    _QUEUE_MAX = 4096
     
     def __init__(self, title: str):
         if not CTK_AVAILABLE:
@@ -41,14 +51,30 @@ class ModernUI:
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
         
-        self.queue = queue.Queue()
+        # Bounded: under log floods lines are dropped (they are still in the log
+        # file); control items that do not fit go to an unbounded side deque
+        self.queue = queue.Queue(maxsize=self._QUEUE_MAX)
+        self._overflow = collections.deque()
+        # Bumped by producer threads, read and reset by the UI thread
+        self._drop_lock = threading.Lock()
+        self._dropped_logs = 0
+        self._last_drop_notice = 0.0
+        self._poll_ms = self._POLL_MIN_MS
         self._start_time = time.time()
         self._last_eta = '—'
+        self._last_elapsed_text = ''
         self._filters = {'info': True, 'warn': True, 'error': True, 'success': True, 'verbose': False}
+        # Bit mask of shown levels, read by the logger before queueing lines
+        self.level_mask = sum(LEVEL_BITS[lvl] for lvl, on in self._filters.items() if on)
         self._is_complete = False
         # Animation state
-        self._spinner_frames = ['⠋','⠙','⠹','⠸','⠼','⠴','⠦','⠧','⠇','⠏']
-        self._spinner_index = 0
+        self._spinner_frames = ('⠋','⠙','⠹','⠸','⠼','⠴','⠦','⠧','⠇','⠏')
+        # Endless (frame, status pulse color) iterator starting after the initial frame
+        n = len(self._spinner_frames)
+        self._spinner_cycle = itertools.cycle(tuple(
+            (self._spinner_frames[i % n], COLOR_ACCENT if i % 2 == 0 else COLOR_ACCENT_LIGHT)
+            for i in range(1, n + 1)
+        ))
         self._spin_job = None
         self._progress_target = 0.0
         self._progress_job = None
@@ -299,22 +325,36 @@ class ModernUI:
         self.root.after(120, self._spin)
     
     def enqueue(self, item: tuple):
-        """Add item to processing queue"""
-        self.queue.put(item)
+        """Add item to processing queue (never blocks)"""
+        is_log = bool(item) and item[0] == 'log'
+        if not is_log and self._overflow:
+            # Earlier control items are waiting in the overflow; queue behind
+            # them so headers, results and statuses are applied in order
+            self._overflow.append(item)
+            return
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            if is_log:
+                with self._drop_lock:
+                    self._dropped_logs += 1
+            else:
+                self._overflow.append(item)
+
+    def enqueue_many(self, items: list):
+        """Add several items with a single queue operation (applied in order)"""
+        if items:
+            self.enqueue(('many', items))
     
     def _append_log(self, level: str, line: str):
-        """Append log message to textbox with color and line limiting"""
-        if not self._filters.get(level, True):
-            return
+        """Append a single log message to the textbox"""
+        self._append_logs([(level, [line])])
 
-        # Trim old lines to keep UI responsive
-        self._log_line_count += 1
-        if self._log_line_count > self._max_log_lines:
-            self.log_textbox.configure(state="normal")
-            # Delete first 100 lines
-            self.log_textbox.delete("1.0", "100.0")
-            self._log_line_count -= 100
-            self.log_textbox.configure(state="disabled")
+    def _append_logs(self, runs):
+        """Append runs of (level, lines) to the textbox in one widget update"""
+        runs = [(level, lines) for level, lines in runs if self._filters.get(level, True)]
+        if not runs:
+            return
 
         # Color map for log levels
         color_map = {
@@ -324,25 +364,40 @@ class ModernUI:
             'success': COLOR_SUCCESS,
             'verbose': COLOR_MUTED_DARK,
         }
-        prefix = {
+        prefixes = {
             'info': '→ ',
             'warn': '⚠ ',
             'error': '✗ ',
             'success': '✓ ',
             'verbose': '… '
-        }.get(level, '')
-
-        tag = f"log_{level}"
-        color = color_map.get(level, COLOR_FG)
+        }
 
-        self.log_textbox.configure(state="normal")
+        # Follow new output only if the user has not scrolled up to read
         try:
-            self.log_textbox.tag_config(tag, foreground=color)
-            self.log_textbox.insert("end", prefix + line, tag)
+            autoscroll = self.log_textbox.yview()[1] >= 0.999
         except Exception:
-            # Fallback: insert without color if tag_config not supported
-            self.log_textbox.insert("end", prefix + line)
-        self.log_textbox.see("end")
+            autoscroll = True
+
+        self.log_textbox.configure(state="normal")
+        for level, lines in runs:
+            prefix = prefixes.get(level, '')
+            text = ''.join(prefix + line for line in lines)
+            tag = f"log_{level}"
+            try:
+                self.log_textbox.tag_config(tag, foreground=color_map.get(level, COLOR_FG))
+                self.log_textbox.insert("end", text, tag)
+            except Exception:
+                # Fallback: insert without color if tag_config not supported
+                self.log_textbox.insert("end", text)
+            self._log_line_count += len(lines)
+
+        # Trim old lines to keep UI responsive (drop in chunks of 100)
+        if self._log_line_count > self._max_log_lines:
+            drop = ((self._log_line_count - self._max_log_lines) // 100 + 1) * 100
+            self.log_textbox.delete("1.0", f"{drop + 1}.0")
+            self._log_line_count -= drop
+        if autoscroll:
+            self.log_textbox.see("end")
         self.log_textbox.configure(state="disabled")
     
     def set_status(self, text: str):
@@ -380,14 +435,15 @@ class ModernUI:
     
     def _spin(self):
         """Update spinner animation and pulse status color subtly"""
+        if self._is_complete:
+            # Keep the final icon and status color; nothing left to animate
+            self._spin_job = None
+            return
         try:
-            self._spinner_index = (self._spinner_index + 1) % len(self._spinner_frames)
-            self.spinner_label.configure(text=self._spinner_frames[self._spinner_index])
+            frame, pulse = next(self._spinner_cycle)
+            self.spinner_label.configure(text=frame)
             # Subtle pulse by toggling between two accent tones
-            if self._spinner_index % 2 == 0:
-                self.status_label.configure(text_color=COLOR_ACCENT)
-            else:
-                self.status_label.configure(text_color=COLOR_ACCENT_LIGHT)
+            self.status_label.configure(text_color=pulse)
         finally:
             self._spin_job = self.root.after(100, self._spin)
     
@@ -535,27 +591,61 @@ class ModernUI:
         self.stop_button.configure(state=("normal" if enabled else "disabled"))
     
     def _process_queue(self):
-        """Process items from queue"""
+        """Drain the queue and apply it in one batch.
+
+        Consecutive log lines of the same level are inserted together, and only
+        the latest status/progress value is applied.
+        """
+        batch = []
         try:
             while True:
                 item = self.queue.get_nowait()
-                if not item:
-                    continue
-                
-                kind = item[0]
-                if kind == 'log':
-                    _, level, line = item
-                    self._append_log(level, line)
-                elif kind == 'status':
-                    _, text = item
-                    self.set_status(text)
-                elif kind == 'progress':
-                    _, value = item
-                    self.set_progress(value)
-                elif kind == 'progress_to':
-                    _, value = item
-                    self.animate_progress_to(value)
-                elif kind == 'enable_close':
+                if item[0] == 'many':
+                    batch.extend(item[1])
+                else:
+                    batch.append(item)
+        except queue.Empty:
+            pass
+        # Control items in the overflow are newer than any still in the queue
+        # (enqueue routes them there while it is non-empty), so they go last
+        while self._overflow:
+            item = self._overflow.popleft()
+            if item[0] == 'many':
+                batch.extend(item[1])
+            else:
+                batch.append(item)
+
+        runs = []
+        pending = {}
+
+        def _flush():
+            if runs:
+                self._append_logs(runs)
+                runs.clear()
+            if 'status' in pending:
+                self.set_status(pending['status'])
+            if 'progress' in pending:
+                self.set_progress(pending['progress'])
+            if 'progress_to' in pending:
+                self.animate_progress_to(pending['progress_to'])
+            pending.clear()
+
+        for item in batch:
+            if not item:
+                continue
+            kind = item[0]
+            if kind == 'log':
+                _, level, line = item
+                if runs and runs[-1][0] == level:
+                    runs[-1][1].append(line)
+                else:
+                    runs.append((level, [line]))
+            elif kind in ('status', 'progress', 'progress_to'):
+                pending[kind] = item[1]
+            else:
+                # Structural updates keep their order relative to coalesced ones
+                _flush()
+                if kind == 'enable_close':
                     self.enable_close()
                 elif kind == 'step_hdr':
                     _, idx, total, name = item
@@ -565,17 +655,33 @@ class ModernUI:
                 elif kind == 'step_result':
                     _, idx, success = item
                     self._mark_timeline_step(idx, success)
-        except queue.Empty:
-            pass
+        _flush()
+
+        # Report dropped lines at most once per second
+        if self._dropped_logs and time.time() - self._last_drop_notice >= 1.0:
+            with self._drop_lock:
+                dropped, self._dropped_logs = self._dropped_logs, 0
+            self._last_drop_notice = time.time()
+            self._append_logs([('warn', [f"… {dropped} log line(s) not shown (UI busy); see the log file\n"])])
+
+        # Adaptive polling: stay responsive while items keep arriving, back off when idle
+        if batch:
+            self._poll_ms = self._POLL_MIN_MS
+        else:
+            self._poll_ms = min(self._poll_ms * 2, self._POLL_MAX_MS)
         
-        self.root.after(100, self._process_queue)
+        self.root.after(self._poll_ms, self._process_queue)
     
     def _tick_time(self):
         """Update elapsed time display"""
         elapsed = max(0, int(time.time() - self._start_time))
         mm, ss = divmod(elapsed, 60)
         hh, mm = divmod(mm, 60)
-        self.time_label.configure(text=f"⏱ Elapsed: {hh:02d}:{mm:02d}:{ss:02d} • ETA: {self._last_eta}")
+        text = f"⏱ Elapsed: {hh:02d}:{mm:02d}:{ss:02d} • ETA: {self._last_eta}"
+        # Two ticks per second: only touch the widget when the text changed
+        if text != self._last_elapsed_text:
+            self._last_elapsed_text = text
+            self.time_label.configure(text=text)
         self.root.after(500, self._tick_time)
     
     def set_eta(self, seconds_remaining: Optional[float]):
@@ -588,21 +694,29 @@ class ModernUI:
             hh, mm = divmod(mm, 60)
             self._last_eta = f"{hh:02d}:{mm:02d}:{ss:02d}"
     
+    def _set_filter(self, level: str, enabled: bool):
+        """Show or hide a log level in the view and in the logger's queueing"""
+        self._filters[level] = bool(enabled)
+        if enabled:
+            self.level_mask |= LEVEL_BITS[level]
+        else:
+            self.level_mask &= ~LEVEL_BITS[level]
+
     def _toggle_info(self):
         """Toggle info log filter"""
-        self._filters['info'] = self.info_var.get()
+        self._set_filter('info', self.info_var.get())
     
     def _toggle_warn(self):
         """Toggle warning log filter"""
-        self._filters['warn'] = self.warn_var.get()
+        self._set_filter('warn', self.warn_var.get())
     
     def _toggle_error(self):
         """Toggle error log filter"""
-        self._filters['error'] = self.error_var.get()
+        self._set_filter('error', self.error_var.get())
     
     def _toggle_verbose(self):
         """Toggle verbose log filter"""
-        self._filters['verbose'] = self.verbose_var.get()
+        self._set_filter('verbose', self.verbose_var.get())
     
     def run(self):
         """Start UI main loop"""
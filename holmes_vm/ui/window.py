@@ -5,7 +5,10 @@ Main UI window for Holmes VM setup
 Enhanced with Sherlock Holmes mystery theme, smooth animations, and modern design
 """
 
+import collections
+import itertools
 import queue
+import threading
 import time
 from typing import List, Dict, Any, Callable, Optional
 
@@ -21,6 +24,7 @@ except Exception:
     scrolledtext = None
 
 from .colors import *
+from holmes_vm.core.logger import LEVEL_BITS
 
 
 # Sherlock Holmes themed banner for GUI
@@ -41,6 +45,12 @@ class UI:
     - Toast notifications for completion and errors
     - Better button hover and disabled state styling
     """
+
+    # Queue polling interval bounds (ms); see _process_queue
+    _POLL_MIN_MS = 20
+    _POLL_MAX_MS = 250
+    # Maximum queued UI items
+    _QUEUE_MAX = 4096
     
     def __init__(self, title: str):
         if not TK_AVAILABLE:
@@ -63,14 +73,27 @@ class UI:
         except Exception:
             pass
 
-        self.queue = queue.Queue()
+        # Bounded: under log floods lines are dropped (they are still in the log
+        # file); control items that do not fit go to an unbounded side deque
+        self.queue = queue.Queue(maxsize=self._QUEUE_MAX)
+        self._overflow = collections.deque()
+        # Bumped by producer threads, read and reset by the UI thread
+        self._drop_lock = threading.Lock()
+        self._dropped_logs = 0
+        self._last_drop_notice = 0.0
+        self._poll_ms = self._POLL_MIN_MS
         self._anim_target = 0
         self._anim_job = None
         self._start_time = time.time()
         self._last_eta = '—'
+        self._last_elapsed_text = ''
         self._filters = {'info': True, 'warn': True, 'error': True, 'success': True, 'verbose': False}
+        # Bit mask of shown levels, read by the logger before queueing lines
+        self.level_mask = sum(LEVEL_BITS[lvl] for lvl, on in self._filters.items() if on)
         self._log_line_count = 0
         self._max_log_lines = 1000  # Limit log lines for performance
+        self._fade_seq = 0
+        self._is_complete = False
         self._timeline_steps = []
         self._toast_windows = []
 
@@ -142,8 +165,9 @@ class UI:
         self.step_lbl.pack(side='left')
         
         # Spinner next to step
-        self._spinner_frames = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-        self._spinner_index = 0
+        self._spinner_frames = ('⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏')
+        # Endless frame iterator starting after the initially shown frame
+        self._spinner_cycle = itertools.islice(itertools.cycle(self._spinner_frames), 1, None)
         self.spinner_lbl = tk.Label(
             step_info_frame, text=self._spinner_frames[0],
             fg=COLOR_ACCENT_LIGHT, bg=COLOR_BG, font=self.header_font
@@ -350,36 +374,62 @@ class UI:
         self.root.after(500, self._tick_time)
 
     def enqueue(self, item: tuple):
-        """Add item to processing queue"""
-        self.queue.put(item)
+        """Add item to processing queue (never blocks)"""
+        is_log = bool(item) and item[0] == 'log'
+        if not is_log and self._overflow:
+            # Earlier control items are waiting in the overflow; queue behind
+            # them so headers, results and statuses are applied in order
+            self._overflow.append(item)
+            return
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            if is_log:
+                with self._drop_lock:
+                    self._dropped_logs += 1
+            else:
+                self._overflow.append(item)
+
+    def enqueue_many(self, items: list):
+        """Add several items with a single queue operation (applied in order)"""
+        if items:
+            self.enqueue(('many', items))
 
     def _append_log(self, level: str, line: str):
-        """Append log message to log box with improved formatting"""
-        if not self._filters.get(level, True):
+        """Append a single log message to the log box"""
+        self._append_logs([(level, [line])])
+
+    def _append_logs(self, runs):
+        """Append runs of (level, lines) to the log box in one widget update"""
+        runs = [(level, lines) for level, lines in runs if self._filters.get(level, True)]
+        if not runs:
             return
-        
-        # Limit log lines for performance
-        self._log_line_count += 1
-        if self._log_line_count > self._max_log_lines:
-            self.log_box.configure(state='normal')
-            # Delete first 100 lines
-            self.log_box.delete('1.0', '100.0')
-            self._log_line_count -= 100
-            self.log_box.configure(state='disabled')
-            
+
+        # Follow new output only if the user has not scrolled up to read
+        try:
+            autoscroll = self.log_box.yview()[1] >= 0.999
+        except Exception:
+            autoscroll = True
+
         self.log_box.configure(state='normal')
-        # Fade-in simulation: temporarily insert with muted color then recolor after delay
-        tag = level if level in ('info', 'warn', 'error', 'success', 'verbose') else 'info'
-        fade_tag = f"fade_{self._log_line_count}_{tag}"
-        self.log_box.tag_config(fade_tag, foreground=COLOR_MUTED_DARK)
-        self.log_box.insert('end', line, fade_tag)
-        self.log_box.see('end')
-        def _recolor(tag_original=fade_tag, final_tag=tag):
-            try:
-                self.log_box.tag_config(tag_original, foreground=self.log_box.tag_cget(final_tag, 'foreground'))
-            except Exception:
-                pass
-        self.root.after(250, _recolor)
+        for level, lines in runs:
+            tag = level if level in ('info', 'warn', 'error', 'success', 'verbose') else 'info'
+            # Fade-in simulation: the muted fade tag (created later, so higher
+            # priority) is dropped after a delay to reveal the level color
+            self._fade_seq += 1
+            fade_tag = f"fade_{self._fade_seq}"
+            self.log_box.tag_config(fade_tag, foreground=COLOR_MUTED_DARK)
+            self.log_box.insert('end', ''.join(lines), (tag, fade_tag))
+            self.root.after(250, lambda t=fade_tag: self.log_box.tag_delete(t))
+            self._log_line_count += len(lines)
+
+        # Limit log lines for performance (drop in chunks of 100)
+        if self._log_line_count > self._max_log_lines:
+            drop = ((self._log_line_count - self._max_log_lines) // 100 + 1) * 100
+            self.log_box.delete('1.0', f'{drop + 1}.0')
+            self._log_line_count -= drop
+        if autoscroll:
+            self.log_box.see('end')
         self.log_box.configure(state='disabled')
 
     def set_status(self, text: str):
@@ -507,6 +557,7 @@ class UI:
 
     def enable_close(self):
         """Enable close button and show completion summary"""
+        self._is_complete = True
         self.close_btn.configure(state='normal')
         self.stop_btn.configure(state='disabled')
 
@@ -545,27 +596,61 @@ class UI:
         self.stop_btn.configure(state='normal' if enabled else 'disabled')
 
     def _process_queue(self):
-        """Process items from queue"""
+        """Drain the queue and apply it in one batch.
+
+        Consecutive log lines of the same level are inserted together, and only
+        the latest status/progress value is applied.
+        """
+        batch = []
         try:
             while True:
                 item = self.queue.get_nowait()
-                if not item:
-                    continue
-                    
-                kind = item[0]
-                if kind == 'log':
-                    _, level, line = item
-                    self._append_log(level, line)
-                elif kind == 'status':
-                    _, text = item
-                    self.set_status(text)
-                elif kind == 'progress':
-                    _, value = item
-                    self.set_progress(value)
-                elif kind == 'progress_to':
-                    _, value = item
-                    self.animate_progress_to(value)
-                elif kind == 'enable_close':
+                if item[0] == 'many':
+                    batch.extend(item[1])
+                else:
+                    batch.append(item)
+        except queue.Empty:
+            pass
+        # Control items in the overflow are newer than any still in the queue
+        # (enqueue routes them there while it is non-empty), so they go last
+        while self._overflow:
+            item = self._overflow.popleft()
+            if item[0] == 'many':
+                batch.extend(item[1])
+            else:
+                batch.append(item)
+
+        runs = []
+        pending = {}
+
+        def _flush():
+            if runs:
+                self._append_logs(runs)
+                runs.clear()
+            if 'status' in pending:
+                self.set_status(pending['status'])
+            if 'progress' in pending:
+                self.set_progress(pending['progress'])
+            if 'progress_to' in pending:
+                self.animate_progress_to(pending['progress_to'])
+            pending.clear()
+
+        for item in batch:
+            if not item:
+                continue
+            kind = item[0]
+            if kind == 'log':
+                _, level, line = item
+                if runs and runs[-1][0] == level:
+                    runs[-1][1].append(line)
+                else:
+                    runs.append((level, [line]))
+            elif kind in ('status', 'progress', 'progress_to'):
+                pending[kind] = item[1]
+            else:
+                # Structural updates keep their order relative to coalesced ones
+                _flush()
+                if kind == 'enable_close':
                     self.enable_close()
                 elif kind == 'step_hdr':
                     _, idx, total, name = item
@@ -575,15 +660,29 @@ class UI:
                 elif kind == 'step_result':
                     _, idx, success = item
                     self._mark_timeline_step(idx, success)
-        except queue.Empty:
-            pass
-            
-        self.root.after(100, self._process_queue)
+        _flush()
+
+        # Report dropped lines at most once per second
+        if self._dropped_logs and time.time() - self._last_drop_notice >= 1.0:
+            with self._drop_lock:
+                dropped, self._dropped_logs = self._dropped_logs, 0
+            self._last_drop_notice = time.time()
+            self._append_logs([('warn', [f"… {dropped} log line(s) not shown (UI busy); see the log file\n"])])
+
+        # Adaptive polling: stay responsive while items keep arriving, back off when idle
+        if batch:
+            self._poll_ms = self._POLL_MIN_MS
+        else:
+            self._poll_ms = min(self._poll_ms * 2, self._POLL_MAX_MS)
+
+        self.root.after(self._poll_ms, self._process_queue)
 
     def _spin(self):
         """Update spinner animation"""
-        self._spinner_index = (self._spinner_index + 1) % len(self._spinner_frames)
-        self.spinner_lbl.configure(text=self._spinner_frames[self._spinner_index])
+        if self._is_complete:
+            # Keep the final icon set by enable_close
+            return
+        self.spinner_lbl.configure(text=next(self._spinner_cycle))
         self.root.after(100, self._spin)
 
     def _tick_time(self):
@@ -591,7 +690,11 @@ class UI:
         elapsed = max(0, int(time.time() - self._start_time))
         mm, ss = divmod(elapsed, 60)
         hh, mm = divmod(mm, 60)
-        self.elapsed_lbl.configure(text=f"⏱ Elapsed: {hh:02d}:{mm:02d}:{ss:02d} • ETA: {self._last_eta}")
+        text = f"⏱ Elapsed: {hh:02d}:{mm:02d}:{ss:02d} • ETA: {self._last_eta}"
+        # Two ticks per second: only touch the widget when the text changed
+        if text != self._last_elapsed_text:
+            self._last_elapsed_text = text
+            self.elapsed_lbl.configure(text=text)
         self.root.after(500, self._tick_time)
 
     def set_eta(self, seconds_remaining: Optional[float]):
@@ -604,21 +707,29 @@ class UI:
             hh, mm = divmod(mm, 60)
             self._last_eta = f"{hh:02d}:{mm:02d}:{ss:02d}"
 
+    def _set_filter(self, level: str, enabled: bool):
+        """Show or hide a log level in the view and in the logger's queueing"""
+        self._filters[level] = bool(enabled)
+        if enabled:
+            self.level_mask |= LEVEL_BITS[level]
+        else:
+            self.level_mask &= ~LEVEL_BITS[level]
+
     def _toggle_info(self):
         """Toggle info log filter"""
-        self._filters['info'] = bool(self.filter_info.var.get())
+        self._set_filter('info', bool(self.filter_info.var.get()))
 
     def _toggle_warn(self):
         """Toggle warning log filter"""
-        self._filters['warn'] = bool(self.filter_warn.var.get())
+        self._set_filter('warn', bool(self.filter_warn.var.get()))
 
     def _toggle_error(self):
         """Toggle error log filter"""
-        self._filters['error'] = bool(self.filter_error.var.get())
+        self._set_filter('error', bool(self.filter_error.var.get()))
     
     def _toggle_verbose(self):
         """Toggle verbose log filter"""
-        self._filters['verbose'] = bool(self.filter_verbose.var.get())
+        self._set_filter('verbose', bool(self.filter_verbose.var.get()))
 
     def run(self):
         """Start UI main loop"""
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared worker pool for Holmes VM setup
+"""
+
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool, creating it on first use.
+
+    Meant for short I/O-bound fan-out (network probes, parallel install
+    batches). Do not submit work that waits on other pool tasks.
+    """
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                # Work is I/O-bound (downloads, child processes), so the pool
+                # size is not tied to the CPU count
+                _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='holmes')
+                atexit.register(_executor.shutdown, wait=False)
+    return _executor
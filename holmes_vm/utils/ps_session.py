@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent PowerShell host for Holmes VM setup.
+
+Starting powershell.exe costs hundreds of milliseconds per call. Instead, a
+long-lived `powershell.exe -Command -` process is kept around and commands are
+fed to it over stdin. Each command is sent as a single base64-encoded line and
+terminated by a unique marker written to both stdout and stderr, so the reader
+knows when the command finished and what its exit status was.
+"""
+
+import atexit
+import base64
+import queue
+import subprocess
+import threading
+import time
+import uuid
+from typing import Callable, List, Optional
+
+from holmes_vm.utils.system import ps_quote
+
+
+_PS_ARGS = [
+    'powershell.exe', '-NoProfile', '-NoLogo', '-NonInteractive',
+    '-ExecutionPolicy', 'Bypass', '-Command', '-'
+]
+
+# Wrapper run for every command (one line). The script block is invoked in a
+# child scope so functions, variables and strict mode it sets do not leak into
+# later commands; modules imported with -Global stay loaded between commands.
+_WRAPPER = (
+    "$__holmes_rc = 0; "
+    "try {{ {enter}"
+    "& {{ $ErrorActionPreference = 'Stop'; "
+    "& ([ScriptBlock]::Create([Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('{code}')))) }}; "
+    "if (-not $?) {{ $__holmes_rc = 1 }} }} "
+    "catch {{ [Console]::Error.WriteLine(($_ | Out-String).Trim()); $__holmes_rc = 1 }} "
+    "finally {{ {leave}}}; "
+    "[Console]::Out.WriteLine('{marker} ' + $__holmes_rc); [Console]::Out.Flush(); "
+    "[Console]::Error.WriteLine('{marker}'); [Console]::Error.Flush()"
+)
+
+
+class PowerShellSession:
+    """A single long-lived powershell.exe process executing commands sequentially"""
+
+    def __init__(self):
+        self._proc = subprocess.Popen(
+            _PS_ARGS,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, bufsize=1, errors='replace',
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+        self._lines: queue.Queue = queue.Queue()
+        for name, stream in (('out', self._proc.stdout), ('err', self._proc.stderr)):
+            threading.Thread(
+                target=self._pump, args=(name, stream), daemon=True,
+                name=f'holmes-ps-{name}'
+            ).start()
+
+    def _pump(self, name: str, stream):
+        """Forward lines from one pipe to the shared queue; None marks EOF"""
+        try:
+            for line in stream:
+                self._lines.put((name, line))
+        except Exception:
+            pass
+        self._lines.put((name, None))
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def close(self):
+        """Terminate the PowerShell process"""
+        try:
+            if self.alive():
+                self._proc.stdin.close()
+                try:
+                    self._proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    self._proc.kill()
+                    self._proc.wait()
+        except Exception:
+            pass
+
+    def run(self, ps_code: str, cwd: Optional[str] = None, timeout: Optional[float] = 180,
+            on_line: Optional[Callable[[str, str], None]] = None) -> subprocess.CompletedProcess:
+        """Run PowerShell code in this session.
+
+        on_line, if given, is called as on_line(stream, line) for each output line
+        ('out' or 'err') as it arrives. On timeout the process is killed and the
+        session must be discarded.
+        """
+        marker = f"##HOLMES-END-{uuid.uuid4().hex}"
+        code = base64.b64encode(ps_code.encode('utf-8')).decode('ascii')
+        enter = leave = ''
+        if cwd:
+            # Native tools follow the PowerShell location, .NET APIs the process directory
+            sync = "[Environment]::CurrentDirectory = (Get-Location -PSProvider FileSystem).ProviderPath; "
+            enter = f"Push-Location -LiteralPath {ps_quote(cwd)} -ErrorAction Stop; " + sync
+            leave = "Pop-Location; " + sync
+        line = _WRAPPER.format(enter=enter, leave=leave, code=code, marker=marker)
+
+        args = ['powershell.exe', '-Command', ps_code]
+        try:
+            self._proc.stdin.write(line + '\n')
+            self._proc.stdin.flush()
+        except (OSError, ValueError):
+            return subprocess.CompletedProcess(
+                args=args, returncode=1, stdout='', stderr='PowerShell session is not running'
+            )
+
+        out: List[str] = []
+        err: List[str] = []
+        rc = None
+        pending = {'out', 'err'}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while pending:
+            wait = None if deadline is None else deadline - time.monotonic()
+            if wait is not None and wait <= 0:
+                self._proc.kill()
+                self._proc.wait()
+                return subprocess.CompletedProcess(
+                    args=args, returncode=1, stdout='\n'.join(out),
+                    stderr=f'PowerShell command timed out after {timeout}s'
+                )
+            try:
+                name, text = self._lines.get(timeout=wait)
+            except queue.Empty:
+                continue
+            if text is None:
+                # Host exited (e.g. the code called `exit`); drain the other pipe
+                pending.discard(name)
+                continue
+            text = text.rstrip('\r\n')
+            pos = text.find(marker)
+            if pos >= 0:
+                pending.discard(name)
+                if name == 'out':
+                    try:
+                        rc = int(text[pos + len(marker):].strip() or 1)
+                    except ValueError:
+                        rc = 1
+                text = text[:pos]
+                if not text:
+                    continue
+            (out if name == 'out' else err).append(text)
+            if on_line:
+                on_line(name, text)
+
+        if rc is None:
+            rc = self._proc.wait()
+        return subprocess.CompletedProcess(
+            args=args, returncode=rc, stdout='\n'.join(out), stderr='\n'.join(err)
+        )
+
+
+_idle: List[PowerShellSession] = []
+_all: List[PowerShellSession] = []
+_pool_lock = threading.Lock()
+
+
+def _acquire() -> PowerShellSession:
+    """Take an idle live session, or start a new one"""
+    with _pool_lock:
+        while _idle:
+            session = _idle.pop()
+            if session.alive():
+                return session
+            _all.remove(session)
+    session = PowerShellSession()
+    with _pool_lock:
+        _all.append(session)
+    return session
+
+
+def _release(session: PowerShellSession):
+    """Return a session to the pool (dead sessions are dropped)"""
+    with _pool_lock:
+        if session.alive():
+            _idle.append(session)
+        elif session in _all:
+            _all.remove(session)
+
+
+def run(ps_code: str, cwd: Optional[str] = None, timeout: Optional[float] = 180,
+        on_line: Optional[Callable[[str, str], None]] = None) -> subprocess.CompletedProcess:
+    """Run PowerShell code in a pooled persistent session.
+
+    Raises FileNotFoundError if powershell.exe cannot be started.
+    """
+    session = _acquire()
+    try:
+        return session.run(ps_code, cwd=cwd, timeout=timeout, on_line=on_line)
+    finally:
+        _release(session)
+
+
+def close_sessions():
+    """Terminate all PowerShell sessions"""
+    with _pool_lock:
+        sessions = list(_all)
+        _all.clear()
+        _idle.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_sessions)
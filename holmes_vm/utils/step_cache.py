@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Completed-step markers for Holmes VM setup.
+
+Steps that only need to run once per machine (Chocolatey bootstrap, theme)
+record a fingerprint of what they applied. A re-run after a partial failure
+can then skip them while nothing relevant has changed.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, Optional
+
+
+_lock = threading.Lock()
+_entries: Optional[Dict[str, dict]] = None
+
+
+def _cache_file() -> str:
+    """Location of the marker file (per user, survives reboots)"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+        return os.path.join(base, 'HolmesVM', 'step_cache.json')
+    return os.path.join(os.path.expanduser('~'), '.holmesvm', 'step_cache.json')
+
+
+def _load() -> Dict[str, dict]:
+    """Read the marker file once; a missing or corrupt file means an empty cache"""
+    global _entries
+    if _entries is None:
+        try:
+            with open(_cache_file(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            _entries = data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            _entries = {}
+    return _entries
+
+
+def fingerprint(*parts) -> str:
+    """Hash the inputs a step depends on (str or bytes)"""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def file_fingerprint(path: str) -> str:
+    """Fingerprint of a file's contents; empty if it cannot be read"""
+    try:
+        with open(path, 'rb') as f:
+            return fingerprint(f.read())
+    except OSError:
+        return ''
+
+
+def is_done(key: str, fp: str, max_age: Optional[float] = None) -> bool:
+    """True if the step was marked done with this fingerprint (and recently enough)"""
+    with _lock:
+        entry = _load().get(key)
+    if not isinstance(entry, dict) or entry.get('fp') != fp:
+        return False
+    if max_age is not None:
+        try:
+            return time.time() - float(entry.get('at', 0)) <= max_age
+        except (TypeError, ValueError):
+            return False
+    return True
+
+
+def mark_done(key: str, fp: str):
+    """Record a step as done; failures to persist are ignored"""
+    with _lock:
+        entries = _load()
+        entries[key] = {'fp': fp, 'at': time.time()}
+        path = _cache_file()
+        tmp = path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
@@ -6,12 +6,15 @@ System utilities for Holmes VM setup
 
 import sys
 import ctypes
+import functools
 import subprocess
 import os
+import shutil
 
 
+@functools.lru_cache(maxsize=1)
 def is_admin() -> bool:
-    """Check if running with administrator privileges"""
+    """Check if running with administrator privileges (cached; cannot change mid-run)"""
     try:
         return ctypes.windll.shell32.IsUserAnAdmin() != 0
     except Exception:
@@ -23,6 +26,22 @@ def is_windows() -> bool:
     return sys.platform == 'win32'
 
 
+def copy_file(src: str, dest: str):
+    """Copy a file, using the native CopyFileW on Windows.
+
+    Falls back to shutil.copyfile if the native call is unavailable or fails
+    (errors from the fallback propagate to the caller).
+    """
+    if sys.platform == 'win32':
+        try:
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            if kernel32.CopyFileW(ctypes.c_wchar_p(src), ctypes.c_wchar_p(dest), False):
+                return
+        except Exception:
+            pass
+    shutil.copyfile(src, dest)
+
+
 def run_powershell(ps_code: str, cwd: str = None, timeout: int = 180) -> subprocess.CompletedProcess:
     """Run PowerShell code and return result.
 
@@ -40,24 +59,18 @@ def run_powershell(ps_code: str, cwd: str = None, timeout: int = 180) -> subproc
             args=[], returncode=1,
             stdout='', stderr='PowerShell is not available on this platform'
         )
-    cmd = [
-        'powershell.exe', '-NoProfile', '-ExecutionPolicy', 'Bypass',
-        '-Command', f"$ErrorActionPreference='Stop'; {ps_code}"
-    ]
+    from holmes_vm.utils import ps_session
     try:
-        return subprocess.run(
-            cmd, cwd=cwd, capture_output=True, text=True, timeout=timeout
-        )
-    except subprocess.TimeoutExpired:
-        return subprocess.CompletedProcess(
-            args=cmd, returncode=1,
-            stdout='', stderr=f'PowerShell command timed out after {timeout}s'
-        )
+        res = ps_session.run(ps_code, cwd=cwd, timeout=timeout)
     except FileNotFoundError:
         return subprocess.CompletedProcess(
-            args=cmd, returncode=1,
+            args=['powershell.exe'], returncode=1,
             stdout='', stderr='powershell.exe not found on PATH'
         )
+    # Keep the trailing newline callers saw from a one-shot process
+    if res.stdout:
+        res.stdout += '\n'
+    return res
 
 
 def run_powershell_streamed(ps_code: str, logger=None, cwd: str = None, timeout: int = 180) -> subprocess.CompletedProcess:
@@ -73,72 +86,51 @@ def run_powershell_streamed(ps_code: str, logger=None, cwd: str = None, timeout:
             args=[], returncode=1,
             stdout='', stderr='PowerShell is not available on this platform'
         )
-    cmd = [
-        'powershell.exe', '-NoProfile', '-ExecutionPolicy', 'Bypass',
-        '-Command', f"$ErrorActionPreference='Stop'; {ps_code}"
-    ]
+    from holmes_vm.utils import ps_session
+
+    def _on_line(stream, line):
+        if logger and line:
+            logger.info(f'  {line}', verbose=True)
+
     try:
-        proc = subprocess.Popen(
-            cmd, cwd=cwd,
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-            text=True, bufsize=1,
-            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
-        )
+        res = ps_session.run(ps_code, cwd=cwd, timeout=timeout, on_line=_on_line)
     except FileNotFoundError:
         return subprocess.CompletedProcess(
-            args=cmd, returncode=1,
+            args=['powershell.exe'], returncode=1,
             stdout='', stderr='powershell.exe not found on PATH'
         )
+    # Streamed callers only ever saw non-empty lines
+    res.stdout = '\n'.join(l for l in res.stdout.split('\n') if l)
+    res.stderr = '\n'.join(l for l in res.stderr.split('\n') if l)
+    return res
 
-    stdout_lines = []
-    stderr_lines = []
 
-    def _read_stream(stream, lines_list, level):
-        for line in stream:
-            stripped = line.rstrip('\n\r')
-            if not stripped:
-                continue
-            lines_list.append(stripped)
-            if logger:
-                logger.info(f'  {stripped}', verbose=True)
+# PowerShell treats the typographic single quotes like ' inside a
+# single-quoted string, so all of them are doubled
+_PS_QUOTE = str.maketrans({q: q * 2 for q in "'\u2018\u2019\u201a\u201b"})
 
-    import threading as _threading
-    t_out = _threading.Thread(target=_read_stream, args=(proc.stdout, stdout_lines, 'INFO'), daemon=True)
-    t_err = _threading.Thread(target=_read_stream, args=(proc.stderr, stderr_lines, 'WARN'), daemon=True)
-    t_out.start()
-    t_err.start()
 
-    try:
-        proc.wait(timeout=timeout)
-    except subprocess.TimeoutExpired:
-        proc.kill()
-        proc.wait()
-        return subprocess.CompletedProcess(
-            args=cmd, returncode=1,
-            stdout='\n'.join(stdout_lines),
-            stderr=f'PowerShell command timed out after {timeout}s'
-        )
+def ps_quote(value) -> str:
+    """Quote a value as a PowerShell single-quoted (verbatim) string literal"""
+    return "'" + str(value).translate(_PS_QUOTE) + "'"
 
-    t_out.join(timeout=5)
-    t_err.join(timeout=5)
 
-    return subprocess.CompletedProcess(
-        args=cmd,
-        returncode=proc.returncode,
-        stdout='\n'.join(stdout_lines),
-        stderr='\n'.join(stderr_lines)
+@functools.lru_cache(maxsize=4)
+def _import_preamble(module_path: str) -> str:
+    """Module import prefix for a module path, escaped and formatted once"""
+    return (
+        "if (-not (Get-Module -Name 'Holmes.Common')) "
+        f"{{ Import-Module {ps_quote(module_path)} -Force -DisableNameChecking -Global }}; "
     )
 
 
 def import_common_module_and(ps_inner: str, module_path: str) -> str:
-    """Generate PowerShell code to import common module and run command"""
-    mod = module_path.replace('`', '``').replace("'", "''")
-    return f"Import-Module '{mod}' -Force -DisableNameChecking; {ps_inner}"
+    """Generate PowerShell code to import common module (once per session) and run command"""
+    return _import_preamble(module_path) + ps_inner
 
 
 def dot_source_and(ps1_path: str, call: str) -> str:
     """Generate PowerShell code to dot-source script and call function"""
-    p = ps1_path.replace('`', '``').replace("'", "''")
-    return f". '{p}'; {call}"
+    return f". {ps_quote(ps1_path)}; {call}"
 
 
@@ -16,14 +16,6 @@ function Invoke-ProgressStep { [CmdletBinding()] param([Parameter(Mandatory)][st
 function New-MinimalInstallerWindow { throw 'Per-installer GUI was removed. Use setup.ps1 unified GUI.' }
 function Start-EZToolsInstaller { throw 'Per-installer GUI was removed. Use setup.ps1 unified GUI.' }
 
-function Ensure-Directory { param([Parameter(Mandatory)][string]$Path) if (-not (Test-Path -LiteralPath $Path)) { New-Item -ItemType Directory -Path $Path -Force | Out-Null } }
-
-function Add-PathIfMissing { [CmdletBinding()] param([Parameter(Mandatory)][string]$Path,[ValidateSet('Machine','User')][string]$Scope='Machine') try { $target = if ($Scope -eq 'Machine') { 'HKLM:\SYSTEM\CurrentControlSet\Control\Session Manager\Environment' } else { 'HKCU:\Environment' }; $cur = (Get-ItemProperty -Path $target -Name Path -ErrorAction SilentlyContinue).Path; if ($cur -notmatch [regex]::Escape($Path)) { $new = if ($cur) { "$cur;$Path" } else { $Path }; Set-ItemProperty -Path $target -Name Path -Value $new } } catch { } }
-
-function Expand-Zip { param([Parameter(Mandatory)][string]$ZipPath,[Parameter(Mandatory)][string]$Destination) Expand-Archive -Path $ZipPath -DestinationPath $Destination -Force }
-
-function Invoke-SafeDownload { [CmdletBinding()] param([Parameter(Mandatory)][string]$Uri,[Parameter(Mandatory)][string]$OutFile) try { Invoke-WebRequest -Uri $Uri -OutFile $OutFile -UseBasicParsing -ErrorAction Stop; return $true } catch { try { (New-Object System.Net.WebClient).DownloadFile($Uri,$OutFile); return $true } catch { return $false } } }
-
 function Install-EZTools {
     [CmdletBinding(SupportsShouldProcess)]
     param([string]$Destination = 'C:\\Tools\\EricZimmermanTools',[int]$NetVersion = 0,[string]$LogDir,[string]$ShortcutCategory,[switch]$SkipShortcuts)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the persistent PowerShell host (Windows only)"""
+
+import shutil
+import unittest
+
+from holmes_vm.utils.ps_session import PowerShellSession
+
+
+@unittest.skipUnless(shutil.which('powershell.exe'), 'powershell.exe is not available')
+class PowerShellSessionScopeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = PowerShellSession()
+        self.addCleanup(self.session.close)
+
+    def test_function_does_not_leak_into_next_command(self):
+        defined = self.session.run("function Test-HolmesLeak { 'leaked' }; Test-HolmesLeak")
+        self.assertEqual(defined.returncode, 0)
+        self.assertEqual(defined.stdout.strip(), 'leaked')
+
+        probe = self.session.run(
+            "if (Get-Command Test-HolmesLeak -ErrorAction SilentlyContinue) { 'visible' } else { 'hidden' }"
+        )
+        self.assertEqual(probe.returncode, 0)
+        self.assertEqual(probe.stdout.strip(), 'hidden')
+
+    def test_strict_mode_does_not_leak_into_next_command(self):
+        self.assertEqual(self.session.run("Set-StrictMode -Version Latest").returncode, 0)
+        probe = self.session.run("$null -eq $undefinedHolmesVariable")
+        self.assertEqual(probe.returncode, 0)
+        self.assertEqual(probe.stdout.strip(), 'True')
+
+
+if __name__ == '__main__':
+    unittest.main()